@@ -1,11 +1,15 @@
 """MSXターミナル用カラー出力ユーティリティ"""
 
+import sys
 from typing import Dict
 
 from colorama import Fore, Style, init
 
 init()
 
+# リセットシーケンス（呼び出しごとの属性参照を避ける）
+_RESET = Style.RESET_ALL
+
 # カラーマッピング
 COLORS: Dict[str, str] = {
     "info": Fore.CYAN,
@@ -22,7 +26,7 @@ COLORS: Dict[str, str] = {
 
 def _colorize(message: str, color: str) -> str:
     """Apply color to message"""
-    return f"{color}{message}{Style.RESET_ALL}"
+    return color + message + _RESET
 
 
 def _print_colored(message: str, color_key: str, **kwargs: object) -> None:
@@ -69,28 +73,30 @@ def print_help(message: str) -> None:
 
 def print_receive(message: str, end: str = "\n") -> None:
     """Print received message"""
-    _print_colored(message, "receive", end=end)
+    # print()の引数処理を避け、色・本文・終端を一度の書き込みにまとめる
+    sys.stdout.write(COLORS["receive"] + message + _RESET + end)
 
 
 def print_prompt_receive(message: str) -> None:
     """Print prompt received message (no newline)"""
-    _print_colored(message, "receive", end="", flush=True)
+    sys.stdout.write(COLORS["receive"] + message + _RESET)
+    sys.stdout.flush()
 
 
 # 文字列生成関数
 def str_info(message: str) -> str:
     """Generate colored info string"""
-    return _colorize(f"[info]{message}", COLORS["info"])
+    return COLORS["info"] + "[info]" + message + _RESET
 
 
 def str_warn(message: str) -> str:
     """Generate colored warning string"""
-    return _colorize(f"[warn] {message}", COLORS["warn"])
+    return COLORS["warn"] + "[warn] " + message + _RESET
 
 
 def str_error(message: str) -> str:
     """Generate colored error string"""
-    return _colorize(f"[error] {message}", COLORS["error"])
+    return COLORS["error"] + "[error] " + message + _RESET
 
 
 def str_exception(message: str, e: Exception) -> str:
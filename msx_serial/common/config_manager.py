@@ -177,14 +177,6 @@ class ConfigManager:
                 min_value=0.0,
                 max_value=1.0,
             ),
-            ConfigSchema(
-                "performance.batch_size",
-                1,
-                "バッチサイズ（バイト）",
-                int,
-                min_value=1,
-                max_value=1024,
-            ),
             ConfigSchema(
                 "performance.timeout_check_interval",
                 0.01,
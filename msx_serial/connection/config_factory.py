@@ -2,50 +2,64 @@
 Configuration factory for connection types
 """
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
 
+from .base import ConnectionConfig
 from .dummy import DummyConfig
 from .serial import SerialConfig
 from .telnet import TelnetConfig
-from .uri_parser import ParsedUri
-
-
-class ParameterExtractor:
-    """Helper class for extracting and converting URI parameters"""
-
-    def __init__(self, params: Optional[Dict[str, List[str]]]):
-        self.params = params or {}
-
-    def get_int(self, name: str, default: int) -> int:
-        """Get integer parameter"""
-        if name in self.params and self.params[name]:
-            try:
-                return int(self.params[name][0])
-            except (ValueError, IndexError):
-                return default
-        return default
-
-    def get_str(self, name: str, default: str) -> str:
-        """Get string parameter"""
-        if name in self.params and self.params[name]:
-            return self.params[name][0]
-        return default
-
-    def get_bool(self, name: str, default: bool = False) -> bool:
-        """Get boolean parameter"""
-        if name in self.params and self.params[name]:
-            value = self.params[name][0].lower()
-            return value in ("true", "1", "yes", "on")
-        return default
-
-    def get_timeout(self) -> Optional[int]:
-        """Get timeout parameter with special handling"""
-        if "timeout" in self.params and self.params["timeout"]:
-            try:
-                return int(self.params["timeout"][0])
-            except (ValueError, IndexError):
-                pass
-        return None
+from .uri_parser import ParsedUri, normalize_scheme
+
+
+def _mark_validated(config: ConnectionConfig) -> None:
+    """Mark config as already satisfying validator invariants"""
+    object.__setattr__(config, "_validated", True)
+
+
+def _parse_bool(value: str) -> bool:
+    """Convert URI parameter string to boolean"""
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+# シリアル設定のクエリパラメータ名と変換関数
+# （未指定・変換失敗時はSerialConfigの既定値を使う）
+_SERIAL_PARAM_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "baudrate": int,
+    "bytesize": int,
+    "parity": str,
+    "stopbits": int,
+    "timeout": int,
+    "xonxoff": _parse_bool,
+    "rtscts": _parse_bool,
+    "dsrdtr": _parse_bool,
+}
+
+
+def extract_serial_params(
+    params: Optional[Mapping[str, Sequence[str]]],
+) -> Dict[str, Any]:
+    """Convert URI query parameters to SerialConfig keyword arguments
+
+    Args:
+        params: Query parameters from the parsed URI
+
+    Returns:
+        Keyword arguments for the parameters that were given and valid
+    """
+    kwargs: Dict[str, Any] = {}
+    if not params:
+        return kwargs
+
+    # クエリ側を1回だけ走査し、既知のパラメータのみ変換する
+    for name, values in params.items():
+        converter = _SERIAL_PARAM_CONVERTERS.get(name)
+        if converter is None or not values:
+            continue
+        try:
+            kwargs[name] = converter(values[0])
+        except ValueError:
+            continue
+    return kwargs
 
 
 class ConfigFactory:
@@ -71,7 +85,10 @@ class ConfigFactory:
         if parsed_uri.port is not None and parsed_uri.port <= 0:
             raise ValueError("Port must be a positive integer")
         port = parsed_uri.port if parsed_uri.port is not None else 23
-        return TelnetConfig(host=parsed_uri.host, port=port)
+        config = TelnetConfig(host=parsed_uri.host, port=port)
+        # ホストとポートは上で検証済み
+        _mark_validated(config)
+        return config
 
     @staticmethod
     def create_serial_config(parsed_uri: ParsedUri) -> SerialConfig:
@@ -91,20 +108,13 @@ class ConfigFactory:
         if not port:
             raise ValueError("Path or host is required for serial connection")
 
-        # Extract parameters using helper
-        extractor = ParameterExtractor(parsed_uri.query_params)
-
-        return SerialConfig(
-            port=port,
-            baudrate=extractor.get_int("baudrate", 115200),
-            bytesize=extractor.get_int("bytesize", 8),
-            parity=extractor.get_str("parity", "N"),
-            stopbits=extractor.get_int("stopbits", 1),
-            timeout=extractor.get_timeout(),
-            xonxoff=extractor.get_bool("xonxoff"),
-            rtscts=extractor.get_bool("rtscts"),
-            dsrdtr=extractor.get_bool("dsrdtr"),
+        config = SerialConfig(
+            port=port, **extract_serial_params(parsed_uri.query_params)
         )
+        # クエリ未指定ならすべて既定値なので検証不要
+        if not parsed_uri.query_params:
+            _mark_validated(config)
+        return config
 
     @staticmethod
     def create_dummy_config(parsed_uri: ParsedUri) -> DummyConfig:
@@ -133,18 +143,23 @@ class ConfigFactory:
         Raises:
             ValueError: If scheme is not supported
         """
-        scheme = parsed_uri.scheme.lower()
+        scheme = normalize_scheme(parsed_uri.scheme)
 
-        config_creators = {
-            "telnet": cls.create_telnet_config,
-            "serial": cls.create_serial_config,
-            "dummy": cls.create_dummy_config,
-        }
-
-        if scheme not in config_creators:
+        creator = _CONFIG_CREATORS.get(scheme)
+        if creator is None:
             raise ValueError(f"Unsupported scheme: {scheme}")
 
-        return config_creators[scheme](parsed_uri)  # type: ignore
+        return creator(parsed_uri)
+
+
+# スキームごとの生成関数（呼び出しごとの辞書構築を避ける）
+_CONFIG_CREATORS: Dict[
+    str, Callable[[ParsedUri], Union[TelnetConfig, SerialConfig, DummyConfig]]
+] = {
+    "telnet": ConfigFactory.create_telnet_config,
+    "serial": ConfigFactory.create_serial_config,
+    "dummy": ConfigFactory.create_dummy_config,
+}
 
 
 class ConnectionConfigValidator:
@@ -205,6 +220,10 @@ class ConnectionConfigValidator:
         Raises:
             ValueError: If configuration is invalid
         """
+        # ConfigFactoryで検証済みの設定は再検証しない
+        if getattr(config, "_validated", False):
+            return
+
         if isinstance(config, TelnetConfig):
             cls.validate_telnet_config(config)
         elif isinstance(config, SerialConfig):
@@ -2,6 +2,7 @@
 Connection configuration detection and creation
 """
 
+from functools import lru_cache
 from typing import Union
 
 from .config_factory import ConfigFactory, ConnectionConfigValidator
@@ -46,6 +47,12 @@ class ConnectionDetector:
         return config
 
 
+@lru_cache(maxsize=64)
+def _config_for_uri(uri: str) -> Union[TelnetConfig, SerialConfig, DummyConfig]:
+    """URIごとの設定をキャッシュ（設定はfrozenなので共有しても安全）"""
+    return ConnectionDetector().detect_connection_type(uri)
+
+
 # Backward compatibility: maintain the original function interface
 def detect_connection_type(uri: str) -> Union[TelnetConfig, SerialConfig, DummyConfig]:
     """URI形式の接続先から接続タイプを判定する
@@ -59,5 +66,7 @@ def detect_connection_type(uri: str) -> Union[TelnetConfig, SerialConfig, DummyC
     Raises:
         ValueError: If URI format is invalid
     """
-    detector = ConnectionDetector()
-    return detector.detect_connection_type(uri)
+    if not isinstance(uri, str):
+        # キャッシュキーにできない値はそのまま検出処理に渡してエラーにする
+        return ConnectionDetector().detect_connection_type(uri)
+    return _config_for_uri(uri)
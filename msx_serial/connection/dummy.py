@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .base import Connection, ConnectionConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class DummyConfig(ConnectionConfig):
     """Dummy connection configuration"""
 
@@ -19,7 +19,9 @@ class DummyConnection(Connection):
         self.config = config
         self._open = True
         self._read_buffer: queue.Queue[int] = queue.Queue()
-        self._write_buffer: list[bytes] = []
+        # 送信データは連続したbytearrayに蓄積し、チャンク境界のみ記録する
+        self._write_buffer = bytearray()
+        self._write_chunk_offsets: list[int] = [0]
 
         # Put initial message in receive buffer
         self._simulate_receive("Welcome to MSX Dummy Terminal\r\n")
@@ -38,7 +40,8 @@ class DummyConnection(Connection):
         return bytes(data)
 
     def write(self, data: bytes) -> None:
-        self._write_buffer.append(data)
+        self._write_buffer.extend(data)
+        self._write_chunk_offsets.append(len(self._write_buffer))
         # Immediately put written content into "receive" (echo back)
         self._simulate_receive(data.decode("utf-8", errors="ignore"))
 
@@ -56,4 +59,6 @@ class DummyConnection(Connection):
 
     def get_sent_data(self) -> list[bytes]:
         """For testing: get sent data"""
-        return self._write_buffer
+        view = memoryview(self._write_buffer)
+        offsets = self._write_chunk_offsets
+        return [bytes(view[start:end]) for start, end in zip(offsets, offsets[1:])]
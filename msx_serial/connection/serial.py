@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from typing import Optional, cast
 
@@ -6,7 +7,7 @@ import serial
 from .base import Connection, ConnectionConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class SerialConfig(ConnectionConfig):
     port: str = ""
     baudrate: int = 115200
@@ -34,6 +35,20 @@ class SerialConnection(Connection):
             rtscts=config.rtscts,
             dsrdtr=config.dsrdtr,
         )
+        self._fd = self._get_fd()
+
+    def _get_fd(self) -> Optional[int]:
+        """Get file descriptor of the port for direct reads
+
+        Returns:
+            File descriptor on POSIX platforms, None otherwise
+        """
+        try:
+            fd = self.connection.fileno()
+        except Exception:
+            # Windows版pyserialはfilenoを持たない
+            return None
+        return fd if isinstance(fd, int) else None
 
     def write(self, data: bytes) -> None:
         self.connection.write(data)
@@ -41,7 +56,25 @@ class SerialConnection(Connection):
     def flush(self) -> None:
         self.connection.flush()
 
+    def fileno(self) -> Optional[int]:
+        """File descriptor of the port for select (None if unavailable)"""
+        return self._fd
+
     def read(self, size: int) -> bytes:
+        """Read up to size bytes that are already received
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            Received bytes (empty if nothing is available)
+        """
+        if self._fd is not None:
+            # pyserialはポートを非ブロッキングで開くため、受信済み分だけを直接読む
+            try:
+                return os.read(self._fd, size)
+            except BlockingIOError:
+                return b""
         return cast(bytes, self.connection.read(size))
 
     def in_waiting(self) -> int:
@@ -6,8 +6,11 @@ from dataclasses import dataclass
 from ..common.color_output import print_exception
 from .base import Connection, ConnectionConfig
 
+# 1回のrecvで受け取る最大バイト数
+RECV_CHUNK_SIZE = 4096
 
-@dataclass
+
+@dataclass(frozen=True)
 class TelnetConfig(ConnectionConfig):
     """Telnet connection configuration"""
 
@@ -32,6 +35,9 @@ class TelnetConnection(Connection):
         self.socket.setblocking(False)  # Non-blocking for instant reads
 
         self._buffer = bytearray()
+        # recv_into用の受信領域（recvごとのbytes生成を避ける）
+        self._recv_area = bytearray(RECV_CHUNK_SIZE)
+        self._recv_view = memoryview(self._recv_area)
         self._connected = True
 
     def write(self, data: bytes) -> None:
@@ -50,9 +56,10 @@ class TelnetConnection(Connection):
             self._fill_buffer_if_needed(size)
 
             # Return requested size data from buffer
-            data = self._buffer[:size]
-            self._buffer = self._buffer[size:]
-            return bytes(data)
+            data = bytes(self._buffer[:size])
+            # 先頭削除はbytearray内部でオフセット移動となり再確保しない
+            del self._buffer[:size]
+            return data
         except Exception as e:
             print_exception("Telnet read error", e)
             return b""
@@ -66,27 +73,30 @@ class TelnetConnection(Connection):
             # Use select to check for available data without blocking
             ready, _, _ = select.select([self.socket], [], [], 0)
             if ready:
-                # Read up to 4096 bytes of available data
-                data = self.socket.recv(4096)
-                if data:
-                    self._buffer.extend(data)
-                else:
-                    # Connection closed
-                    self._connected = False
+                self._receive_available()
         except socket.error:
             # No data available or connection error
             pass
 
+    def _receive_available(self) -> None:
+        """Receive available data directly into the preallocated area"""
+        received = self.socket.recv_into(self._recv_view, RECV_CHUNK_SIZE)
+        if received:
+            self._buffer += self._recv_view[:received]
+        else:
+            # Connection closed
+            self._connected = False
+
+    def fileno(self) -> int:
+        """File descriptor of the socket for select"""
+        return self.socket.fileno()
+
     def in_waiting(self) -> int:
         try:
             # Check for immediately available data without blocking
             ready, _, _ = select.select([self.socket], [], [], 0)
             if ready:
-                data = self.socket.recv(4096)
-                if data:
-                    self._buffer.extend(data)
-                else:
-                    self._connected = False
+                self._receive_available()
             return len(self._buffer)
         except Exception:
             return len(self._buffer)
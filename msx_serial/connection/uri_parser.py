@@ -3,12 +3,39 @@ URI parsing utilities for connection configuration
 """
 
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence
+from urllib.parse import parse_qs, urlsplit
 
+# 既知スキームの小文字化テーブル（str.lower()のUnicode処理を回避）
+_SCHEME_LOWER: Dict[str, str] = {
+    variant: name
+    for name in ("telnet", "serial", "dummy")
+    for variant in (name, name.upper(), name.capitalize())
+}
 
-@dataclass
+# シリアルポート形式（COMn, /dev/tty*）の判定パターン
+_SERIAL_PORT_PATTERN = re.compile(r"\A(?:COM\d+|/dev/tty\w*)\Z")
+
+# クエリなしURIで共有する空の読み取り専用マッピング
+_EMPTY_QUERY_PARAMS: Mapping[str, Sequence[str]] = MappingProxyType({})
+
+
+def normalize_scheme(scheme: str) -> str:
+    """Normalize URI scheme to lowercase
+
+    Args:
+        scheme: Scheme string
+
+    Returns:
+        Lowercase scheme
+    """
+    return _SCHEME_LOWER.get(scheme) or scheme.lower()
+
+
+@dataclass(frozen=True)
 class ParsedUri:
     """Parsed URI components"""
 
@@ -16,7 +43,10 @@ class ParsedUri:
     host: Optional[str] = None
     port: Optional[int] = None
     path: Optional[str] = None
-    query_params: Optional[Dict[str, List[str]]] = None
+    # マッピングはハッシュできないため、ハッシュ値は他のフィールドから計算する
+    query_params: Optional[Mapping[str, Sequence[str]]] = field(
+        default=None, hash=False
+    )
 
 
 class LegacyFormatParser:
@@ -44,26 +74,16 @@ class LegacyFormatParser:
         Returns:
             ParsedUri if successful, None otherwise
         """
-        if ":" not in uri:
+        # 最後のコロンをポート区切りとする（IPv6アドレスのコロンも自然に扱える）
+        idx = uri.rfind(":")
+        if idx < 0:
             return None
 
         try:
-            # Handle IPv6 addresses that contain multiple colons
-            if uri.count(":") > 1:
-                # Try to find port at the end (IPv6:port format)
-                parts = uri.rsplit(":", 1)
-                if len(parts) == 2:
-                    host, port_str = parts
-                    port = int(port_str)
-                    return ParsedUri(scheme="telnet", host=host, port=port)
-                # IPv6 address without port
-                return ParsedUri(scheme="telnet", host=uri, port=23)
-            else:
-                host, port_str = uri.split(":", 1)
-                port = int(port_str)
-                return ParsedUri(scheme="telnet", host=host, port=port)
+            port = int(uri[idx + 1 :])
         except ValueError:
             return None
+        return ParsedUri(scheme="telnet", host=uri[:idx], port=port)
 
     @staticmethod
     def parse_serial_port(uri: str) -> Optional[ParsedUri]:
@@ -76,7 +96,7 @@ class LegacyFormatParser:
             ParsedUri if successful, None otherwise
         """
         # Check for COM ports or /dev/tty devices
-        if re.match(r"^(COM\d+|/dev/tty\w*)$", uri):
+        if _SERIAL_PORT_PATTERN.match(uri):
             return ParsedUri(scheme="serial", path=uri)
 
         return None
@@ -125,23 +145,33 @@ class StandardUriParser:
             ValueError: If URI format is invalid
         """
         try:
-            parsed = urlparse(uri)
-            scheme = parsed.scheme.lower()
+            # ;params部分は使わないのでurlparseではなくurlsplitで分割する
+            parsed = urlsplit(uri)
+            scheme = normalize_scheme(parsed.scheme)
 
             if not scheme:
                 raise ValueError("Missing scheme")
 
-            query_params = parse_qs(parsed.query) if parsed.query else {}
+            query_params = (
+                # キャッシュした結果を共有するため、値もタプルにして読み取り専用にする
+                MappingProxyType(
+                    {
+                        key: tuple(values)
+                        for key, values in parse_qs(parsed.query).items()
+                    }
+                )
+                if parsed.query
+                else _EMPTY_QUERY_PARAMS
+            )
 
             # Parse netloc for host and port
             host = None
             port = None
             if parsed.netloc:
-                if ":" in parsed.netloc:
-                    host, port_str = parsed.netloc.split(":", 1)
+                # 一度の走査でホストとポートに分割する
+                host, sep, port_str = parsed.netloc.partition(":")
+                if sep:
                     port = int(port_str)
-                else:
-                    host = parsed.netloc
 
             return ParsedUri(
                 scheme=scheme,
@@ -174,7 +204,12 @@ class UriParser:
         if not uri or not isinstance(uri, str):
             raise ValueError("URI must be a non-empty string")
 
-        if LegacyFormatParser.is_legacy_format(uri):
-            return LegacyFormatParser.parse(uri)
-        else:
-            return StandardUriParser.parse(uri)
+        return _parse_uri_cached(uri)
+
+
+@lru_cache(maxsize=128)
+def _parse_uri_cached(uri: str) -> ParsedUri:
+    """URIごとの解析結果をキャッシュ（ParsedUriは不変なので共有可能）"""
+    if LegacyFormatParser.is_legacy_format(uri):
+        return LegacyFormatParser.parse(uri)
+    return StandardUriParser.parse(uri)
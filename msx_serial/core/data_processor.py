@@ -3,6 +3,7 @@ Data processing utilities for MSX terminal
 """
 
 import logging
+import re
 import time
 from typing import List, Optional, Protocol, Tuple
 
@@ -12,6 +13,45 @@ from ..protocol.msx_detector import MSXProtocolDetector
 
 logger = logging.getLogger(__name__)
 
+# MSXプロンプトの一覧（インポート時に一度だけ生成）
+_DRIVE_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PROMPT_PATTERNS: Tuple[str, ...] = (
+    # MSX-DOSプロンプト: A>, B>, ..., Z>
+    *(f"{drive}>" for drive in _DRIVE_LETTERS),
+    # MSX-DOSプロンプト（コロン付き）: A:>, B:>, ..., Z:>
+    *(f"{drive}:>" for drive in _DRIVE_LETTERS),
+    # BASICプロンプト
+    "Ok",
+    "Ready",
+    # エラープロンプト
+    "?Redo from start",
+)
+
+# ドライブ名として扱う文字（統一パターンと同じく大文字小文字を区別しない）
+_DRIVE_LETTER_SET = frozenset(_DRIVE_LETTERS + _DRIVE_LETTERS.lower())
+
+
+def _is_drive_prompt(content: str) -> bool:
+    """Check for an A> / A:> drive prompt without running a regex
+
+    Args:
+        content: Stripped content to check
+
+    Returns:
+        True if content is exactly a drive prompt
+    """
+    length = len(content)
+    if length == 2:
+        return content[1] == ">" and content[0] in _DRIVE_LETTER_SET
+    if length == 3:
+        return content[1:] == ":>" and content[0] in _DRIVE_LETTER_SET
+    return False
+
+
+# プロンプトの末尾になり得る文字（A> / Ok / Ready / ?Redo from start）
+# 即時モードではこれを含まないチャンクでプロンプト検出を省略する
+_PROMPT_END_CHAR_PATTERN = re.compile(r"[>kKyYtT]")
+
 
 class FileSystemManager(Protocol):
     """ファイルシステムマネージャーのプロトコル"""
@@ -45,28 +85,35 @@ class OutputCollector:
     def __init__(self, manager: Optional[FileSystemManager], command_name: str) -> None:
         self.manager = manager
         self.command_name = command_name
-        self.output_buffer = ""
+        # 出力はチャンクのリストに溜め、完了時に一度だけ連結する
+        self._parts: List[str] = []
         self.is_collecting = False
 
+    @property
+    def output_buffer(self) -> str:
+        """収集済みの出力"""
+        return "".join(self._parts)
+
     def start_collection(self) -> None:
         """収集を開始"""
         self.is_collecting = True
-        self.output_buffer = ""
+        self._parts = []
 
     def process_output(self, data: str) -> None:
         """出力を処理"""
         if self.is_collecting:
-            self.output_buffer += data
+            self._parts.append(data)
 
     def finalize_collection(self) -> None:
         """収集を完了しキャッシュを更新"""
         if not self.is_collecting or not self.manager:
             return
 
+        output = self.output_buffer
         try:
-            if self.output_buffer.strip():
+            if output and not output.isspace():
                 if self.command_name == "DIR":
-                    files = self.manager.parse_dir_output(self.output_buffer)
+                    files = self.manager.parse_dir_output(output)
                     current_dir = self.manager.current_directory
                     self.manager.directory_cache[current_dir] = files
                     self.manager.cache_timestamps[current_dir] = time.time()
@@ -74,7 +121,7 @@ class OutputCollector:
                         f"DIRコマンド出力を自動キャッシュ: {len(files)} 個のファイル/ディレクトリ"
                     )
                 elif self.command_name == "FILES":
-                    files = self.manager.parse_files_output(self.output_buffer)
+                    files = self.manager.parse_files_output(output)
                     self.manager.file_cache = files
                     self.manager.cache_timestamp = time.time()
                     logger.debug(
@@ -84,28 +131,64 @@ class OutputCollector:
             logger.warning(f"{self.command_name}出力の自動キャッシュに失敗: {e}")
         finally:
             self.is_collecting = False
-            self.output_buffer = ""
+            self._parts = []
 
 
 class DataBuffer:
     """受信データのバッファ管理"""
 
     def __init__(self) -> None:
-        self.buffer = ""
+        # 受信チャンクをリストに溜め、参照時にまとめて連結する
+        self._parts: List[str] = []
+        self._joined: Optional[str] = ""
+        # 空白以外の文字を受信済みか（has_contentでバッファ全体をstripしない）
+        self._has_nonspace = False
+        # 改行を受信済みか（未完了行の判定でバッファ全体を走査しない）
+        self._has_newline = False
         self.last_update_time = 0.0
+        # clear()の回数（バッファ内の位置を覚えている側が無効化を検知する）
+        self.generation = 0
 
-    def add_data(self, data: str) -> None:
+    @property
+    def buffer(self) -> str:
+        """Current buffer content (kept for compatibility)"""
+        return self.get_content()
+
+    def add_data(self, data: str, now: Optional[float] = None) -> None:
         """Add new data to buffer
 
         Args:
             data: New data to add
+            now: Receive time from time.monotonic() (read the clock if omitted)
         """
-        self.buffer += data
-        self.last_update_time = time.time()
+        self._parts.append(data)
+        self._joined = None
+        if not self._has_nonspace and data and not data.isspace():
+            self._has_nonspace = True
+        if not self._has_newline and "\n" in data:
+            self._has_newline = True
+        self.last_update_time = time.monotonic() if now is None else now
 
     def clear(self) -> None:
         """Clear the buffer"""
-        self.buffer = ""
+        self._parts = []
+        self._joined = ""
+        self._has_nonspace = False
+        self._has_newline = False
+        self.generation += 1
+
+    def set_content(self, data: str) -> None:
+        """Replace buffer content, keeping the last receive time
+
+        Args:
+            data: New buffer content (part of data already received)
+        """
+        self._parts = [data] if data else []
+        self._joined = data
+        self._has_nonspace = bool(data) and not data.isspace()
+        self._has_newline = "\n" in data
+        # 内容を置き換えたのでclear()と同様に位置の無効化を通知する
+        self.generation += 1
 
     def get_content(self) -> str:
         """Get buffer content
@@ -113,18 +196,25 @@ class DataBuffer:
         Returns:
             Current buffer content
         """
-        return self.buffer
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+            # 連結結果を1チャンクにまとめ、次回の連結対象を減らす
+            self._parts = [self._joined]
+        return self._joined
 
-    def is_timeout(self, timeout: float) -> bool:
+    def is_timeout(self, timeout: float, now: Optional[float] = None) -> bool:
         """Check if buffer has timed out
 
         Args:
             timeout: Timeout in seconds
+            now: Current time from time.monotonic() (read the clock if omitted)
 
         Returns:
             True if timed out
         """
-        return (time.time() - self.last_update_time) > timeout
+        if now is None:
+            now = time.monotonic()
+        return (now - self.last_update_time) > timeout
 
     def has_content(self) -> bool:
         """Check if buffer has content
@@ -132,7 +222,23 @@ class DataBuffer:
         Returns:
             True if buffer has content
         """
-        return bool(self.buffer.strip())
+        return self._has_nonspace
+
+    def has_incomplete_line(self) -> bool:
+        """Check if buffer holds data without any line break
+
+        Returns:
+            True if buffer is not empty and contains no line break
+        """
+        return not self._has_newline and any(self._parts)
+
+    def has_line_break(self) -> bool:
+        """Check if buffer contains a line break
+
+        Returns:
+            True if a line break has been added since the last clear
+        """
+        return self._has_newline
 
 
 class DataProcessor:
@@ -147,6 +253,13 @@ class DataProcessor:
         self.last_sent_command: Optional[str] = None
         self.echo_suppressed = False
         self.last_prompt_content = ""
+        # エコー検索の再開位置（検索済み部分を再走査しない）
+        self._echo_search_pos = 0
+        self._echo_search_generation = 0
+        self._echo_match_pos = -1
+        # 直前に判定したバッファ内容とその結果（同じ内容の再判定を避ける）
+        self._detect_cache_content: Optional[str] = None
+        self._detect_cache_result = False
 
         # 出力収集機能
         self.dos_collector: Optional[OutputCollector] = None
@@ -154,6 +267,11 @@ class DataProcessor:
         self._basic_keywords = ConfigManager().get(
             "basic.keywords", ["BASIC", "Microsoft", "Copyright", "Bytes free", "MSX"]
         )
+        # キーワード検索は1回の走査で済むよう正規表現にまとめる
+        self._basic_keywords_pattern = re.compile(
+            "|".join(re.escape(keyword) for keyword in self._basic_keywords),
+            re.IGNORECASE,
+        )
 
     def set_dos_filesystem_manager(
         self, manager: Optional[DOSFileSystemManager]
@@ -191,6 +309,9 @@ class DataProcessor:
         """
         self.last_sent_command = command.strip()
         self.echo_suppressed = False  # Reset echo suppression
+        self._echo_search_pos = 0
+        self._echo_search_generation = self.buffer.generation
+        self._echo_match_pos = -1
 
         # 出力収集を開始
         if self.last_sent_command.upper() == "DIR" and self.dos_collector:
@@ -198,11 +319,14 @@ class DataProcessor:
         elif self.last_sent_command.upper() == "FILES" and self.basic_collector:
             self.basic_collector.start_collection()
 
-    def process_data(self, raw_data: str) -> List[Tuple[str, bool]]:
+    def process_data(
+        self, raw_data: str, now: Optional[float] = None
+    ) -> List[Tuple[str, bool]]:
         """Process incoming data and return formatted output
 
         Args:
             raw_data: Raw received data
+            now: Receive time from time.monotonic() (read the clock if omitted)
 
         Returns:
             List of (text, is_prompt) tuples
@@ -213,90 +337,127 @@ class DataProcessor:
         if self.basic_collector:
             self.basic_collector.process_output(raw_data)
 
+        # 時刻は呼び出しごとに1回だけ取得する
+        if now is None:
+            now = time.monotonic()
         if self.instant_mode:
-            return self._process_data_instant(raw_data)
+            return self._process_data_instant(raw_data, now)
         else:
-            return self._process_data_buffered(raw_data)
+            return self._process_data_buffered(raw_data, now)
 
-    def _process_data_instant(self, raw_data: str) -> List[Tuple[str, bool]]:
+    def _process_data_instant(
+        self, raw_data: str, now: Optional[float] = None
+    ) -> List[Tuple[str, bool]]:
         """Process data in instant mode - immediate display + simultaneous buffering
 
         Args:
             raw_data: Raw received data
+            now: Receive time from time.monotonic()
 
         Returns:
             List of (text, is_prompt) tuples
         """
         output = []
 
-        self._debug_received_data(raw_data)
-
         # Always display received data immediately (core principle)
         if self.echo_suppressed or not self.last_sent_command:
             output.append((raw_data, False))
 
         # Add to buffer for prompt detection
-        self.buffer.add_data(raw_data)
-        current_content = self.buffer.get_content()
+        buffer = self.buffer
+        buffer.add_data(raw_data, now)
+
+        # バッファ全体の連結は内容が必要になるまで行わない
+        current_content: Optional[str] = None
+        echo_removed = False
 
         # Handle command echo suppression
-        if self._should_suppress_echo(current_content):
-            self._process_echo_suppression(current_content)
+        if self.last_sent_command and not self.echo_suppressed:
+            current_content = buffer.get_content()
+            echo_removed = self._should_suppress_echo(current_content)
+            if echo_removed:
+                self._process_echo_suppression(current_content)
+            elif not buffer.has_line_break():
+                # エコー受信中のバッファはプロンプトではないので検出しない
+                # （改行が届いてもエコーが見つからない入力は、^Cや複数行の
+                # 貼り付けのようにエコーされないものとみなして検出を続ける）
+                return output
+
+        # プロンプト検出済みのバッファはクリアされるため、
+        # 新しいプロンプトはプロンプト末尾文字を含むチャンクでのみ完成する
+        if not echo_removed and not _PROMPT_END_CHAR_PATTERN.search(raw_data):
+            return output
+
+        if current_content is None:
+            current_content = buffer.get_content()
 
         # Check for prompt detection (for mode detection only)
-        if self.detector.detect_prompt(current_content):
+        if self._detect_buffer_prompt(current_content):
             self._finalize_output_collections()
             self.last_prompt_content = current_content
-            self.buffer.clear()
+            buffer.clear()
             output.append(("", True))
 
         return output
 
-    def _debug_received_data(self, raw_data: str) -> None:
-        """Debug output for received data"""
-        if hasattr(self.detector, "debug_mode") and self.detector.debug_mode:
-            # Debug output removed for cleaner production code
-            pass
-
     def _should_suppress_echo(self, current_content: str) -> bool:
         """Check if echo should be suppressed"""
-        return bool(
-            self.last_sent_command
-            and not self.echo_suppressed
-            and self.last_sent_command in current_content
-        )
+        command = self.last_sent_command
+        if not command or self.echo_suppressed:
+            return False
+
+        # バッファがクリアされていれば先頭から探し直す
+        if self._echo_search_generation != self.buffer.generation:
+            self._echo_search_generation = self.buffer.generation
+            self._echo_search_pos = 0
+
+        # 前回までに探した範囲はコマンド長-1だけ重ねて再開する
+        searched = min(self._echo_search_pos, len(current_content))
+        start = max(0, searched - len(command) + 1)
+        match_pos = current_content.find(command, start)
+        if match_pos < 0:
+            self._echo_search_pos = len(current_content)
+            return False
+
+        self._echo_match_pos = match_pos
+        return True
 
     def _process_echo_suppression(self, current_content: str) -> None:
         """Process command echo suppression"""
         self.echo_suppressed = True
         if self.last_sent_command:
-            command_end = current_content.find(self.last_sent_command) + len(
-                self.last_sent_command
-            )
+            match_pos = self._echo_match_pos
+            if match_pos < 0:
+                match_pos = current_content.find(self.last_sent_command)
+            command_end = match_pos + len(self.last_sent_command)
         else:
             command_end = 0
+        self._echo_match_pos = -1
 
-        if command_end < len(current_content):
-            remaining = current_content[command_end:].lstrip("\r\n ")
-            self.buffer.clear()
-            if remaining:
-                self.buffer.add_data(remaining)
-        else:
-            self.buffer.clear()
+        # エコー直後の改行・空白を飛ばし、残りを一度だけ切り出す
+        content_len = len(current_content)
+        while command_end < content_len and current_content[command_end] in "\r\n ":
+            command_end += 1
+
+        # 残りデータは元の受信時刻のまま積み直す
+        self.buffer.set_content(current_content[command_end:])
 
-    def _process_data_buffered(self, raw_data: str) -> List[Tuple[str, bool]]:
+    def _process_data_buffered(
+        self, raw_data: str, now: Optional[float] = None
+    ) -> List[Tuple[str, bool]]:
         """Process data in buffered mode - original behavior
 
         Args:
             raw_data: Raw received data
+            now: Receive time from time.monotonic()
 
         Returns:
             List of (text, is_prompt) tuples
         """
-        self.buffer.add_data(raw_data)
+        self.buffer.add_data(raw_data, now)
         output = []
 
-        if self.detector.detect_prompt(self.buffer.get_content()):
+        if self._detect_buffer_prompt(self.buffer.get_content()):
             self._finalize_output_collections()
             lines = self._split_prompt_data()
             output.extend(lines)
@@ -311,6 +472,24 @@ class DataProcessor:
         if self.basic_collector:
             self.basic_collector.finalize_collection()
 
+    def _detect_buffer_prompt(self, content: str) -> bool:
+        """Detect prompt in buffer content, reusing the previous result
+
+        Args:
+            content: Buffer content returned by buffer.get_content()
+
+        Returns:
+            True if prompt is detected
+        """
+        # get_content()はバッファが変わらない限り同じ文字列オブジェクトを返すため、
+        # 同一オブジェクトなら前回の判定結果をそのまま使える
+        if content is self._detect_cache_content:
+            return self._detect_cache_result
+        result = self.detector.detect_prompt(content)
+        self._detect_cache_content = content
+        self._detect_cache_result = result
+        return result
+
     def _is_likely_prompt(self, content: str) -> bool:
         """Check if content looks like a complete prompt
 
@@ -322,6 +501,10 @@ class DataProcessor:
         """
         content = content.strip()
 
+        # 最も多いドライブプロンプトは文字比較だけで判定する
+        if _is_drive_prompt(content):
+            return True
+
         # プロトコル検出器の統一されたパターンを使用
         if self.detector.unified_prompt_pattern.search(content):
             return True
@@ -332,49 +515,33 @@ class DataProcessor:
 
         return False
 
-    def _get_prompt_patterns(self) -> list[str]:
-        """Get list of MSX prompt patterns"""
-        # 正規表現を使った統一されたプロンプトパターン
-        # この方法はより簡潔で保守しやすい
-        prompt_patterns = []
-
-        # MSX-DOSプロンプト: A>, B>, C>, ..., Z>
-        for drive in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            prompt_patterns.append(f"{drive}>")
-
-        # MSX-DOSプロンプト（コロン付き）: A:>, B:>, C:>, ..., Z:>
-        for drive in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            prompt_patterns.append(f"{drive}:>")
-
-        # BASICプロンプト
-        prompt_patterns.extend(["Ok", "Ready"])
-
-        # エラープロンプト
-        prompt_patterns.append("?Redo from start")
-
-        return prompt_patterns
-
     def _has_basic_keywords(self, content: str) -> bool:
         """Check if content contains BASIC-related keywords"""
-        content_upper = content.upper()
-        return any(keyword.upper() in content_upper for keyword in self._basic_keywords)
+        if not self._basic_keywords:
+            return False
+        return self._basic_keywords_pattern.search(content) is not None
 
-    def check_timeout(self, timeout: float = 0.1) -> Optional[Tuple[str, bool]]:
+    def check_timeout(
+        self, timeout: float = 0.1, now: Optional[float] = None
+    ) -> Optional[Tuple[str, bool]]:
         """Check for timeout and process buffered data
 
         Args:
             timeout: Timeout in seconds
+            now: Current time from time.monotonic() (read the clock if omitted)
 
         Returns:
             (text, is_prompt) tuple if timeout occurred, None otherwise
         """
         if self.instant_mode:
             # In instant mode, only check for prompt detection to trigger mode changes
-            if self.buffer.has_content() and self.buffer.is_timeout(timeout):
+            if self.buffer.has_content() and self.buffer.is_timeout(timeout, now):
                 content = self.buffer.get_content()
-                is_prompt = self.detector.detect_prompt(content)
+                is_prompt = self._detect_buffer_prompt(content)
 
                 if is_prompt:
+                    # エコーが来ずに検出が遅れた場合もここで出力収集を完了する
+                    self._finalize_output_collections()
                     # Save prompt content for mode detection and clear buffer
                     self.last_prompt_content = content
                     self.buffer.clear()
@@ -384,9 +551,9 @@ class DataProcessor:
                     self.buffer.clear()
         else:
             # Original buffered behavior
-            if self.buffer.has_content() and self.buffer.is_timeout(timeout):
+            if self.buffer.has_content() and self.buffer.is_timeout(timeout, now):
                 content = self.buffer.get_content()
-                is_prompt = self.detector.detect_prompt(content)
+                is_prompt = self._detect_buffer_prompt(content)
                 self.buffer.clear()
                 return (content, is_prompt)
 
@@ -405,12 +572,13 @@ class DataProcessor:
         return None
 
     def check_prompt_candidate(
-        self, candidate_timeout: float = 0.02
+        self, candidate_timeout: float = 0.02, now: Optional[float] = None
     ) -> Optional[Tuple[str, bool]]:
         """Check for prompt candidate
 
         Args:
             candidate_timeout: Timeout for prompt candidates
+            now: Current time from time.monotonic() (read the clock if omitted)
 
         Returns:
             (text, is_prompt) tuple if candidate found, None otherwise
@@ -418,11 +586,11 @@ class DataProcessor:
         if self.instant_mode:
             # In instant mode, be more aggressive about prompt detection
             if self.buffer.has_content() and self.buffer.is_timeout(
-                candidate_timeout * 0.5
+                candidate_timeout * 0.5, now
             ):  # Faster timeout
                 content = self.buffer.get_content()
                 if self._is_likely_prompt(content):
-                    is_prompt = self.detector.detect_prompt(content)
+                    is_prompt = self._detect_buffer_prompt(content)
                     self.buffer.clear()
                     return (content, is_prompt)
         else:
@@ -430,10 +598,10 @@ class DataProcessor:
             if (
                 self.buffer.has_content()
                 and self.detector.is_prompt_candidate(self.buffer.get_content())
-                and self.buffer.is_timeout(candidate_timeout)
+                and self.buffer.is_timeout(candidate_timeout, now)
             ):
                 content = self.buffer.get_content()
-                is_prompt = self.detector.detect_prompt(content)
+                is_prompt = self._detect_buffer_prompt(content)
                 self.buffer.clear()
                 return (content, is_prompt)
 
@@ -445,17 +613,19 @@ class DataProcessor:
         Returns:
             List of (text, is_prompt) tuples
         """
-        lines = self.buffer.get_content().split("\n")
+        # 最終行だけを切り出し、それ以前の行は改行がある場合のみ分割する
+        head, sep, last_line = self.buffer.get_content().rpartition("\n")
         output = []
 
         # Add all lines except the last as regular data
-        for line in lines[:-1]:
-            if line.strip():
-                output.append((line, False))
+        # （空白行の判定はisspaceで行い、strip済みのコピーを作らない）
+        if sep:
+            for line in head.split("\n"):
+                if line and not line.isspace():
+                    output.append((line, False))
 
         # Check if last line is a prompt
-        last_line = lines[-1]
-        if last_line.strip():
+        if last_line and not last_line.isspace():
             is_prompt = self.detector.detect_prompt(last_line)
             output.append((last_line, is_prompt))
 
@@ -467,5 +637,4 @@ class DataProcessor:
         Returns:
             True if buffer has incomplete data
         """
-        content = self.buffer.get_content()
-        return bool(content) and "\n" not in content
+        return self.buffer.has_incomplete_line()
@@ -2,6 +2,9 @@
 Optimized MSX terminal session with instant response
 """
 
+import codecs
+import re
+import select
 import threading
 import time
 from typing import Optional
@@ -17,6 +20,15 @@ from ..protocol.msx_detector import MSXMode, MSXProtocolDetector
 from ..transfer.file_transfer import FileTransferManager
 from .data_processor import DataProcessor
 
+# 1回の読み込みで受け取る最大バイト数
+MAX_READ_SIZE = 4096
+
+# fdで待機できない接続のポーリング間隔の上限（秒）
+IDLE_POLL_INTERVAL = 0.001
+
+# BASIC起動メッセージのキーワード（BASICのみ大文字小文字を区別しない）
+_BASIC_STARTUP_PATTERN = re.compile(r"(?i:BASIC)|Microsoft|Copyright")
+
 
 class MSXSession:
     """高速応答最適化されたMSXターミナルセッション"""
@@ -50,14 +62,20 @@ class MSXSession:
         self.last_data_time = 0.0
 
         # 設定から最適パフォーマンス値を取得
-        self.receive_delay = get_setting("performance.receive_delay", 0.0001)
-        self.batch_size = get_setting("performance.batch_size", 1)
+        self.receive_delay = float(get_setting("performance.receive_delay", 0.0001))
         self.timeout_check_interval = get_setting(
             "performance.timeout_check_interval", 0.01
         )
 
+        # 一度に複数バイト読むため、文字の途中で区切られても正しく復号できるようにする
+        # （msx-jpのグラフィック文字は0x01で始まる2バイト）
+        # 不正なバイトは置換し、読み込んだチャンク全体を捨てないようにする
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+
         # コンポーネントの初期化
         self.connection = connection
+        # 待機に使う接続のファイルディスクリプタ（取得できない場合はsleepで待つ）
+        self._fd = self._get_connection_fd()
         self.protocol_detector = MSXProtocolDetector()
 
         # 高速モードでデータプロセッサを初期化
@@ -127,6 +145,21 @@ class MSXSession:
             # BASICファイルシステムマネージャーの設定に失敗した場合は無視
             pass
 
+    def _get_connection_fd(self) -> Optional[int]:
+        """Get file descriptor of the connection for waiting on input
+
+        Returns:
+            File descriptor if the connection provides one, None otherwise
+        """
+        fileno = getattr(self.connection, "fileno", None)
+        if fileno is None:
+            return None
+        try:
+            fd = fileno()
+        except Exception:
+            return None
+        return fd if isinstance(fd, int) else None
+
     def run(self) -> None:
         """ターミナルセッションを開始"""
         try:
@@ -149,40 +182,87 @@ class MSXSession:
     def _receive_loop(self) -> None:
         """Data receive loop with instant processing"""
         last_timeout_check = 0.0
-        consecutive_empty_reads = 0
-
-        while not self.stop_event.is_set():
+        last_arrival = 0.0
+        # データ受信間隔の指数移動平均（fdで待機できない接続のポーリング間隔に使う）
+        arrival_interval = self.receive_delay
+
+        # ループ内で毎回行う属性参照をローカル変数に束縛しておく
+        is_stopped = self.stop_event.is_set
+        monotonic = time.monotonic
+        process_incoming_data = self._process_incoming_data
+        check_timeouts = self._check_timeouts
+        timeout_check_interval = self.timeout_check_interval
+        fd = self._fd
+
+        while not is_stopped():
             try:
-                current_time = time.time()
+                # 時刻はループごとに1回だけ取得し、受信処理とタイムアウト判定で共有する
+                current_time = monotonic()
 
                 # Process incoming data
-                had_data = self._process_incoming_data()
+                had_data = process_incoming_data(current_time)
 
                 # Adaptive delay based on data activity
                 if had_data:
-                    consecutive_empty_reads = 0
                     # No delay when data is flowing for maximum responsiveness
-                    pass
+                    if last_arrival:
+                        gap = min(current_time - last_arrival, IDLE_POLL_INTERVAL)
+                        arrival_interval += 0.1 * (gap - arrival_interval)
+                    last_arrival = current_time
+                elif fd is not None and self.connection.is_open():
+                    # データ到着か次のタイムアウトチェックまでブロックして待つ
+                    self._wait_for_data(
+                        fd, timeout_check_interval - (current_time - last_timeout_check)
+                    )
                 else:
-                    consecutive_empty_reads += 1
-                    # Stay very responsive even when idle
-                    if consecutive_empty_reads < 5:
-                        time.sleep(0.0001)  # Stay almost instant initially
-                    else:
-                        time.sleep(0.001)  # Slight slowdown after sustained inactivity
+                    time.sleep(
+                        self._poll_interval(
+                            current_time - last_arrival, arrival_interval
+                        )
+                    )
 
                 # Check timeouts
-                if current_time - last_timeout_check >= self.timeout_check_interval:
-                    self._check_timeouts()
+                if current_time - last_timeout_check >= timeout_check_interval:
+                    check_timeouts(current_time)
                     last_timeout_check = current_time
 
             except Exception as e:
                 print_exception("Receive error", e)
                 break
 
-    def _process_incoming_data(self) -> bool:
+    def _poll_interval(self, idle: float, arrival_interval: float) -> float:
+        """Sleep time before the next poll on a connection without fd
+
+        Args:
+            idle: Seconds since data was last received
+            arrival_interval: Moving average of the data arrival interval
+
+        Returns:
+            Sleep time in seconds
+        """
+        # 受信が続いている間は受信間隔の半分だけ待ち、無受信が続くほど上限まで延ばす
+        interval = 0.5 * max(arrival_interval, idle)
+        return min(max(interval, self.receive_delay), IDLE_POLL_INTERVAL)
+
+    def _wait_for_data(self, fd: int, timeout: float) -> None:
+        """Wait until the connection has data or the timeout expires
+
+        Args:
+            fd: File descriptor of the connection
+            timeout: Maximum wait time in seconds
+        """
+        try:
+            select.select([fd], [], [], max(timeout, 0.0))
+        except (OSError, ValueError):
+            # 終了処理で接続が閉じられた場合など
+            time.sleep(0.001)
+
+    def _process_incoming_data(self, now: Optional[float] = None) -> bool:
         """Process incoming data with instant display
 
+        Args:
+            now: Receive time from time.monotonic() (read the clock if omitted)
+
         Returns:
             True if data was processed, False if no data available
         """
@@ -190,41 +270,48 @@ class MSXSession:
         if not waiting:
             return False
 
-        try:
-            # Read single character for instant processing
-            data = self.connection.read(1)
+        # 受信済みのデータをまとめて読み込む（1バイトずつの読み込みを避ける）
+        data = self.connection.read(min(waiting, MAX_READ_SIZE))
 
-            if not data:
-                return False
+        if not data:
+            return False
 
-            decoded = data.decode(self.encoding)
-            self.last_data_time = time.time()
+        # 不正なバイトは置換されるため、デコードで例外は発生しない
+        decoded = self._decoder.decode(data)
+        if now is None:
+            now = time.monotonic()
+        self.last_data_time = now
+        if not decoded:
+            # マルチバイト文字の先頭バイトのみ受信した場合は次の読み込みを待つ
+            return True
 
-            if not self.suppress_output:
-                # Process and display instantly
-                output_lines = self.data_processor.process_data(decoded)
-                for text, is_prompt in output_lines:
-                    self._display_output(text, is_prompt)
+        if not self.suppress_output:
+            # Process and display instantly
+            output_lines = self.data_processor.process_data(decoded, now)
+            for text, is_prompt in output_lines:
+                self._display_output(text, is_prompt)
 
-            return True  # Data was processed
+        return True  # Data was processed
 
-        except UnicodeDecodeError as e:
-            print_exception("Decode error", e)
-            return False
+    def _check_timeouts(self, now: Optional[float] = None) -> None:
+        """Check for timeouts and process any remaining buffered data
 
-    def _check_timeouts(self) -> None:
-        """Check for timeouts and process any remaining buffered data"""
-        if self.suppress_output:
+        Args:
+            now: Current time from time.monotonic() (read the clock if omitted)
+        """
+        # 以下の判定はいずれもバッファが空なら何もしないため、まとめて先に判定する
+        # （アイドル時のタイマーごとの呼び出しを1回の判定で済ませる）
+        if self.suppress_output or not self.data_processor.buffer.has_content():
             return
 
         # Check for regular timeout
-        timeout_result = self.data_processor.check_timeout(0.1)
+        timeout_result = self.data_processor.check_timeout(0.1, now)
         if timeout_result:
             text, is_prompt = timeout_result
             self._display_output(text, is_prompt)
 
         # Check for prompt candidate timeout
-        prompt_result = self.data_processor.check_prompt_candidate(0.02)
+        prompt_result = self.data_processor.check_prompt_candidate(0.02, now)
         if prompt_result:
             text, is_prompt = prompt_result
             self._display_output(text, is_prompt)
@@ -240,10 +327,10 @@ class MSXSession:
 
     def _is_basic_startup(self, content: str) -> bool:
         """Check if content looks like BASIC startup sequence"""
-        content_upper = content.upper()
-        return (
-            "BASIC" in content_upper or "Microsoft" in content or "Copyright" in content
-        ) and content.strip().endswith("Ok")
+        # 安価な末尾チェックを先に行い、大文字化したコピーも作らない
+        return content.rstrip().endswith("Ok") and bool(
+            _BASIC_STARTUP_PATTERN.search(content)
+        )
 
     def _display_output(self, text: str, is_prompt: bool) -> None:
         """Display output text
@@ -260,7 +347,9 @@ class MSXSession:
         if is_prompt:
             # Use saved prompt content if text is empty (instant mode case)
             prompt_text = (
-                text if text.strip() else self.data_processor.last_prompt_content
+                text
+                if text and not text.isspace()
+                else self.data_processor.last_prompt_content
             )
             if prompt_text:
                 self._update_prompt_state(prompt_text)
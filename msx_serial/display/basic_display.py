@@ -2,28 +2,38 @@
 基本的なターミナル表示機能
 """
 
-import subprocess
+import os
 import sys
+import time
 from typing import Optional
 
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
 
+# 端末幅を再取得するまでの間隔（秒）
+TERMINAL_WIDTH_CACHE_TTL = 0.5
+
+# 画面消去とカーソルのホーム移動（Windowsではcoloramaが変換する）
+CLEAR_SCREEN_SEQUENCE = "\x1b[2J\x1b[H"
+
 
 class TerminalDisplay:
     """ターミナル表示機能を提供するクラス"""
 
     def __init__(self, receive_color: str = "#00ff00") -> None:
         self.receive_color = receive_color
+        # 表示スタイルは受信ごとに組み立てず、初期化時に一度だけ作る
+        self._regular_style = receive_color
+        self._prompt_style = f"{receive_color} bold"
+        self._terminal_width: Optional[int] = None
+        self._width_checked_at: Optional[float] = None
 
     def clear_screen(self) -> None:
         """画面をクリア"""
         try:
-            if sys.platform == "win32":
-                subprocess.run(["cmd", "/c", "cls"], check=False, timeout=5)
-            else:
-                subprocess.run(["clear"], check=False, timeout=5)
-        except (subprocess.SubprocessError, FileNotFoundError, OSError):
+            sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+            sys.stdout.flush()
+        except (OSError, ValueError):
             # 画面クリアに失敗した場合は何もしない
             pass
 
@@ -36,8 +46,8 @@ class TerminalDisplay:
         """
         text_to_display = self._wrap_text_if_needed(text)
 
-        color = f"{self.receive_color} bold" if is_prompt else self.receive_color
-        print_formatted_text(FormattedText([(color, text_to_display)]))
+        style = self._prompt_style if is_prompt else self._regular_style
+        print_formatted_text(FormattedText(((style, text_to_display),)))
 
     def _wrap_text_if_needed(self, text: str, max_width: Optional[int] = None) -> str:
         """必要に応じてテキストを改行
@@ -49,18 +59,31 @@ class TerminalDisplay:
         Returns:
             整形されたテキスト
         """
-        try:
-            import os
-
-            terminal_size = os.get_terminal_size()
-            terminal_width = terminal_size.columns
-
-            if len(text) > terminal_width:
-                lines = []
-                for i in range(0, len(text), terminal_width):
-                    lines.append(text[i : i + terminal_width])
-                return "\n".join(lines)
+        terminal_width = self._get_terminal_width()
+        if terminal_width is None:
             return text
 
-        except OSError:
+        if len(text) <= terminal_width:
             return text
+        # join()は内部でリスト化するため、ジェネレータではなく内包表記で渡す
+        return "\n".join(
+            [text[i : i + terminal_width] for i in range(0, len(text), terminal_width)]
+        )
+
+    def _get_terminal_width(self) -> Optional[int]:
+        """端末幅を取得（受信のたびにioctlを発行しないよう一定時間キャッシュする）
+
+        Returns:
+            端末幅（取得できない場合はNone）
+        """
+        now = time.monotonic()
+        if (
+            self._width_checked_at is None
+            or now - self._width_checked_at >= TERMINAL_WIDTH_CACHE_TTL
+        ):
+            try:
+                self._terminal_width = os.get_terminal_size().columns
+            except OSError:
+                self._terminal_width = None
+            self._width_checked_at = now
+        return self._terminal_width
@@ -2,36 +2,35 @@
 拡張ターミナル表示機能
 """
 
-import subprocess
 import sys
 import time
 from threading import RLock
 from typing import Any, Dict
 
+from .basic_display import CLEAR_SCREEN_SEQUENCE
+
 
 class EnhancedTerminalDisplay:
     """拡張ターミナル表示機能を提供するクラス"""
 
     def __init__(self) -> None:
-        self.last_output_time = time.time()
+        self.last_output_time = time.monotonic()
         self.total_bytes_displayed = 0
         self.performance_mode = "enhanced"
-        self.stats = {
-            "total_writes": 0,
-            "instant_writes": 0,
-            "buffered_writes": 0,
-            "total_bytes": 0,
-        }
+        # 統計は書き込みごとに更新するため、辞書ではなく整数属性で保持する
+        self._total_writes = 0
+        self._instant_writes = 0
+        self._buffered_writes = 0
+        self._total_bytes = 0
         self._output_lock = RLock()
 
     def clear_screen(self) -> None:
         """画面クリア"""
         try:
-            if sys.platform == "win32":
-                subprocess.run(["cmd", "/c", "cls"], check=False, timeout=5)
-            else:
-                subprocess.run(["clear"], check=False, timeout=5)
-        except (subprocess.SubprocessError, FileNotFoundError, OSError):
+            with self._output_lock:
+                sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+                sys.stdout.flush()
+        except (OSError, ValueError):
             # 画面クリアに失敗した場合は何もしない
             pass
 
@@ -46,8 +45,12 @@ class EnhancedTerminalDisplay:
         with self._output_lock:
             # Always write instantly
             self._write_instant(formatted)
-            self.total_bytes_displayed += len(formatted.encode("utf-8"))
-            self.last_output_time = time.time()
+            # ASCIIのみならUTF-8でも文字数とバイト数が等しいので、エンコードを省く
+            if formatted.isascii():
+                self.total_bytes_displayed += len(formatted)
+            else:
+                self.total_bytes_displayed += len(formatted.encode("utf-8"))
+            self.last_output_time = time.monotonic()
 
     def _write_instant(self, text: str) -> None:
         """即座にテキストを出力
@@ -57,7 +60,7 @@ class EnhancedTerminalDisplay:
         """
         sys.stdout.write(text)
         sys.stdout.flush()
-        self.stats["instant_writes"] += 1
+        self._instant_writes += 1
 
     def flush(self) -> None:
         """出力をフラッシュ"""
@@ -69,4 +72,14 @@ class EnhancedTerminalDisplay:
         Returns:
             統計情報の辞書
         """
-        return self.stats.copy()
+        return {
+            "total_writes": self._total_writes,
+            "instant_writes": self._instant_writes,
+            "buffered_writes": self._buffered_writes,
+            "total_bytes": self._total_bytes,
+        }
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """パフォーマンス統計（呼び出しごとに生成する）"""
+        return self.get_performance_stats()
@@ -19,25 +19,28 @@ class MSXMode(Enum):
 class MSXProtocolDetector:
     """MSXプロンプトを検出してモード状態を管理"""
 
-    def __init__(self, debug_mode: bool = False):
-        # 統一されたMSXプロンプトパターン
-        # DOS: A>, B>, C>, etc. (全アルファベット対応)
-        self.dos_prompt_pattern = re.compile(r"^[A-Z]>\s*$")
-        # DOS with colon: A:>, B:>, C:>, etc.
-        self.dos_colon_prompt_pattern = re.compile(r"^[A-Z]:>\s*$")
-        # BASIC: Ok, Ready
-        self.basic_prompt_pattern = re.compile(r"^(Ok|Ready)\s*$", re.IGNORECASE)
-        # エラープロンプト: ?Redo from start
-        self.error_prompt_pattern = re.compile(r"^\?Redo from start\s*$", re.IGNORECASE)
-
-        # 統合されたプロンプトパターン（すべてを一度にチェック）
-        self.unified_prompt_pattern = re.compile(
-            r"^([A-Z]>|[A-Z]:>|Ok|Ready|\?Redo from start)\s*$", re.IGNORECASE
-        )
-
-        # 後方互換性のためのエイリアス
-        self.prompt_pattern = self.dos_prompt_pattern
+    # 統一されたMSXプロンプトパターン（インポート時に一度だけコンパイル）
+    # DOS: A>, B>, C>, etc. (全アルファベット対応)
+    dos_prompt_pattern = re.compile(r"^[A-Z]>\s*$")
+    # DOS with colon: A:>, B:>, C:>, etc.
+    dos_colon_prompt_pattern = re.compile(r"^[A-Z]:>\s*$")
+    # BASIC: Ok, Ready
+    basic_prompt_pattern = re.compile(r"^(Ok|Ready)\s*$", re.IGNORECASE)
+    # エラープロンプト: ?Redo from start
+    error_prompt_pattern = re.compile(r"^\?Redo from start\s*$", re.IGNORECASE)
+
+    # 統合されたプロンプトパターン（すべてを一度にチェック）
+    unified_prompt_pattern = re.compile(
+        r"^([A-Z]>|[A-Z]:>|Ok|Ready|\?Redo from start)\s*$", re.IGNORECASE
+    )
+
+    # 複数行バッファ中のいずれかの行がDOSプロンプトか（行分割せずに一度で走査）
+    dos_line_prompt_pattern = re.compile(r"^[^\S\n]*[A-Z]:?>[^\S\n]*$", re.MULTILINE)
+
+    # 後方互換性のためのエイリアス
+    prompt_pattern = dos_prompt_pattern
 
+    def __init__(self, debug_mode: bool = False):
         self.current_mode = MSXMode.UNKNOWN.value
         self.debug_mode = debug_mode
 
@@ -59,38 +62,36 @@ class MSXProtocolDetector:
         stripped_buffer = buffer.strip()
 
         # 統合されたパターンで単一行プロンプトをチェック
-        single_line_result = bool(self.unified_prompt_pattern.search(stripped_buffer))
-
-        if single_line_result:
-            self._debug_print(
-                f"detect_prompt('{buffer.strip()}') -> {single_line_result} (single-line)"
-            )
-            return single_line_result
+        if self.unified_prompt_pattern.search(stripped_buffer):
+            if self.debug_mode:
+                self._debug_print(
+                    f"detect_prompt('{stripped_buffer}') -> True (single-line)"
+                )
+            return True
 
         # Check for multi-line text ending with BASIC prompt
         if "\n" in stripped_buffer:
-            lines = stripped_buffer.split("\n")
-            last_line = lines[-1].strip()
+            # 最終行だけを切り出す（バッファ全体を行リストに分割しない）
+            last_line = stripped_buffer.rpartition("\n")[2].strip()
 
             # Check if the last line is a BASIC prompt
             if self.basic_prompt_pattern.search(last_line):
-                self._debug_print(
-                    f"detect_prompt('{buffer.strip()}') -> True (multi-line BASIC)"
-                )
+                if self.debug_mode:
+                    self._debug_print(
+                        f"detect_prompt('{stripped_buffer}') -> True (multi-line BASIC)"
+                    )
                 return True
 
             # Check if any line ending is a DOS prompt
-            for line in lines:
-                line = line.strip()
-                if self.dos_prompt_pattern.search(
-                    line
-                ) or self.dos_colon_prompt_pattern.search(line):
+            if self.dos_line_prompt_pattern.search(stripped_buffer):
+                if self.debug_mode:
                     self._debug_print(
-                        f"detect_prompt('{buffer.strip()}') -> True (multi-line DOS)"
+                        f"detect_prompt('{stripped_buffer}') -> True (multi-line DOS)"
                     )
-                    return True
+                return True
 
-        self._debug_print(f"detect_prompt('{buffer.strip()}') -> False")
+        if self.debug_mode:
+            self._debug_print(f"detect_prompt('{stripped_buffer}') -> False")
         return False
 
     def is_prompt_candidate(self, buffer: str) -> bool:
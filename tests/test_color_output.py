@@ -76,19 +76,21 @@ def test_print_help():
 
 
 def test_print_receive():
-    with patch("builtins.print") as mock_print:
+    with patch("sys.stdout") as mock_stdout:
         color_output.print_receive("recv", end="!")
-        mock_print.assert_called_once()
-        assert "recv" in mock_print.call_args[0][0]
-        assert mock_print.call_args[1]["end"] == "!"
+        mock_stdout.write.assert_called_once_with(
+            colorama.Fore.GREEN + "recv" + colorama.Style.RESET_ALL + "!"
+        )
+        mock_stdout.flush.assert_not_called()
 
 
 def test_print_prompt_receive():
-    with patch("builtins.print") as mock_print:
+    with patch("sys.stdout") as mock_stdout:
         color_output.print_prompt_receive("prompt")
-        mock_print.assert_called_once()
-        assert mock_print.call_args[1]["end"] == ""
-        assert mock_print.call_args[1]["flush"] is True
+        mock_stdout.write.assert_called_once_with(
+            colorama.Fore.GREEN + "prompt" + colorama.Style.RESET_ALL
+        )
+        mock_stdout.flush.assert_called_once()
 
 
 def test_str_info():
@@ -123,6 +125,16 @@ def test_set_color_config():
     color_output.set_color_config(info=orig)
 
 
+def test_str_info_follows_color_config():
+    orig = color_output.COLORS["info"]
+    color_output.set_color_config(info=colorama.Fore.BLUE)
+    try:
+        s = color_output.str_info("abc")
+        assert s == colorama.Fore.BLUE + "[info]abc" + colorama.Style.RESET_ALL
+    finally:
+        color_output.set_color_config(info=orig)
+
+
 def test_set_color_config_invalid_key():
     # 無効なキーは無視される
     before = color_output.COLORS.copy()
@@ -2,6 +2,8 @@
 Tests for configuration factory and validation
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from msx_serial.connection.config_factory import (ConfigFactory,
@@ -123,6 +125,15 @@ class TestConfigFactory:
             config = self.factory.create_serial_config(parsed_uri)
             assert config.xonxoff is expected
 
+    def test_create_serial_config_ignores_unknown_params(self):
+        """Test unknown and empty query parameters are ignored"""
+        params = {"unknown": ["1"], "parity": [], "baudrate": ["9600"]}
+        parsed_uri = ParsedUri(scheme="serial", path="COM1", query_params=params)
+        config = self.factory.create_serial_config(parsed_uri)
+
+        assert config.baudrate == 9600
+        assert config.parity == "N"
+
     def test_create_serial_config_missing_path(self):
         """Test serial config without path"""
         parsed_uri = ParsedUri(scheme="serial")
@@ -288,3 +299,22 @@ class TestConnectionConfigValidator:
         config = SerialConfig(port="", baudrate=-1)
         with pytest.raises(ValueError, match="Port cannot be empty"):
             self.validator.validate_config(config)
+
+    def test_validate_config_skips_factory_telnet(self):
+        """Test validate_config skips telnet configs built by ConfigFactory"""
+        config = ConfigFactory.create_telnet_config(
+            ParsedUri(scheme="telnet", host="localhost", port=23)
+        )
+        with patch.object(
+            ConnectionConfigValidator, "validate_telnet_config"
+        ) as mock_validate:
+            self.validator.validate_config(config)
+        mock_validate.assert_not_called()
+
+    def test_validate_config_factory_serial_with_query(self):
+        """Test validate_config still checks serial configs with query params"""
+        config = ConfigFactory.create_serial_config(
+            ParsedUri(scheme="serial", path="COM1", query_params={"parity": ["X"]})
+        )
+        with pytest.raises(ValueError, match="Parity must be one of"):
+            self.validator.validate_config(config)
@@ -2,6 +2,8 @@
 Integration tests for connection configuration
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from msx_serial.connection.connection import (ConnectionDetector,
@@ -140,6 +142,24 @@ class TestDetectConnectionTypeFunction:
         config = detect_connection_type("dummy://")
         assert isinstance(config, DummyConfig)
 
+    def test_function_caches_by_uri(self):
+        """Test repeated URI returns the cached config"""
+        first = detect_connection_type("telnet://cached-host:2223")
+        second = detect_connection_type("telnet://cached-host:2223")
+        assert first is second
+
+    def test_function_cached_config_is_immutable(self):
+        """Test cached config cannot be mutated by callers"""
+        config = detect_connection_type("telnet://cached-host:2223")
+        with pytest.raises(FrozenInstanceError):
+            config.port = 24
+
+    def test_function_invalid_uri_not_cached(self):
+        """Test invalid URI keeps raising"""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Port must be a positive integer"):
+                detect_connection_type("telnet://localhost:0")
+
 
 class TestEdgeCases:
     """エッジケースのテスト"""
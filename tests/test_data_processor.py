@@ -4,7 +4,8 @@ Tests for data processor module
 
 from unittest.mock import Mock, patch
 
-from msx_serial.core.data_processor import DataBuffer, DataProcessor
+from msx_serial.core.data_processor import (PROMPT_PATTERNS, DataBuffer,
+                                            DataProcessor, _is_drive_prompt)
 from msx_serial.protocol.msx_detector import MSXProtocolDetector
 
 
@@ -22,24 +23,53 @@ class TestDataBuffer:
 
     def test_add_data(self):
         """Test adding data to buffer"""
-        with patch("time.time", return_value=123.456):
+        with patch("time.monotonic", return_value=123.456):
             self.buffer.add_data("test data")
             assert self.buffer.buffer == "test data"
             assert self.buffer.last_update_time == 123.456
 
     def test_add_multiple_data(self):
         """Test adding multiple data chunks"""
-        with patch("time.time", return_value=123.456):
+        with patch("time.monotonic", return_value=123.456):
             self.buffer.add_data("first")
             self.buffer.add_data(" second")
             assert self.buffer.buffer == "first second"
 
+    def test_get_content_after_more_data(self):
+        """Test content is rejoined after new data arrives"""
+        self.buffer.add_data("A")
+        assert self.buffer.get_content() == "A"
+        self.buffer.add_data(">")
+        self.buffer.add_data(" ")
+        assert self.buffer.get_content() == "A> "
+        self.buffer.clear()
+        self.buffer.add_data("Ok")
+        assert self.buffer.get_content() == "Ok"
+
+    def test_add_data_with_timestamp(self):
+        """Test adding data with a caller-supplied receive time"""
+        with patch("time.monotonic") as mock_monotonic:
+            self.buffer.add_data("test", 42.0)
+            mock_monotonic.assert_not_called()
+        assert self.buffer.last_update_time == 42.0
+
     def test_clear(self):
         """Test clearing buffer"""
         self.buffer.add_data("test")
         self.buffer.clear()
         assert self.buffer.buffer == ""
 
+    def test_set_content(self):
+        """Test replacing content keeps the receive time"""
+        self.buffer.add_data("DIR\r\nA>", 5.0)
+        generation = self.buffer.generation
+        self.buffer.set_content("A>")
+        assert self.buffer.get_content() == "A>"
+        assert self.buffer.last_update_time == 5.0
+        assert self.buffer.generation == generation + 1
+        self.buffer.set_content("")
+        assert self.buffer.has_content() is False
+
     def test_get_content(self):
         """Test getting buffer content"""
         self.buffer.add_data("content")
@@ -50,6 +80,14 @@ class TestDataBuffer:
         self.buffer.add_data("content")
         assert self.buffer.has_content() is True
 
+    def test_is_timeout_with_given_time(self):
+        """Test is_timeout uses the given time instead of the clock"""
+        self.buffer.add_data("test", now=100.0)
+        with patch("time.monotonic") as mock_monotonic:
+            assert self.buffer.is_timeout(0.1, now=100.05) is False
+            assert self.buffer.is_timeout(0.1, now=100.2) is True
+            mock_monotonic.assert_not_called()
+
     def test_has_content_false_empty(self):
         """Test has_content when buffer is empty"""
         assert self.buffer.has_content() is False
@@ -59,16 +97,27 @@ class TestDataBuffer:
         self.buffer.add_data("   \n\t  ")
         assert self.buffer.has_content() is False
 
+    def test_has_content_after_whitespace_chunks(self):
+        """Test has_content tracks chunks and resets on clear"""
+        self.buffer.add_data("\r\n")
+        self.buffer.add_data("")
+        assert self.buffer.has_content() is False
+        self.buffer.add_data("A>")
+        self.buffer.add_data(" ")
+        assert self.buffer.has_content() is True
+        self.buffer.clear()
+        assert self.buffer.has_content() is False
+
     def test_is_timeout_true(self):
         """Test timeout detection when timed out"""
-        with patch("time.time", side_effect=[100.0, 101.5]):
+        with patch("time.monotonic", side_effect=[100.0, 101.5]):
             self.buffer.add_data("test")
             result = self.buffer.is_timeout(1.0)
             assert result is True
 
     def test_is_timeout_false(self):
         """Test timeout detection when not timed out"""
-        with patch("time.time", side_effect=[100.0, 100.5]):
+        with patch("time.monotonic", side_effect=[100.0, 100.5]):
             self.buffer.add_data("test")
             result = self.buffer.is_timeout(1.0)
             assert result is False
@@ -161,37 +210,92 @@ class TestDataProcessor:
         assert self.processor.buffer.get_content() == ""
         assert self.processor.last_prompt_content == "A>"
 
-    def test_process_data_instant_mode_with_echo_suppression(self):
-        """Test processing data in instant mode with echo suppression"""
+    def test_process_data_instant_mode_skips_detection_without_prompt_end(self):
+        """Test instant mode skips prompt detection for chunks that cannot end a prompt"""
+        self.processor.set_instant_mode(True)
+
+        self.processor.process_data("abc 123\r\n")
+        self.mock_detector.detect_prompt.assert_not_called()
+
+        self.processor.process_data("A>")
+        self.mock_detector.detect_prompt.assert_called_once()
+
+    def test_process_data_instant_mode_defers_buffer_join(self):
+        """Test buffer content is joined only when detection needs it"""
         self.processor.set_instant_mode(True)
-        self.processor.set_last_command("LIST")
-        self.processor.echo_suppressed = True
         self.mock_detector.detect_prompt.return_value = False
 
-        result = self.processor.process_data("some output")
+        with patch.object(
+            self.processor.buffer,
+            "get_content",
+            wraps=self.processor.buffer.get_content,
+        ) as mock_get_content:
+            self.processor.process_data("10 CLS\r\n")
+            mock_get_content.assert_not_called()
+            self.processor.process_data("A>")
+            mock_get_content.assert_called_once()
+
+    def test_detect_result_reused_for_unchanged_buffer(self):
+        """Test timeout checks reuse the detection result of unchanged content"""
+        self.processor.set_instant_mode(True)
+        self.mock_detector.detect_prompt.return_value = False
 
-        assert result == [("some output", False)]
+        self.processor.process_data("Hello>")
+        assert self.mock_detector.detect_prompt.call_count == 1
+
+        with patch.object(self.processor.buffer, "is_timeout", return_value=True):
+            self.processor.check_timeout(0.1)
+        assert self.mock_detector.detect_prompt.call_count == 1
 
-    def test_debug_received_data_with_debug_mode(self):
-        """Test debug output when debug mode is enabled"""
-        self.mock_detector.debug_mode = True
+        self.processor.process_data("A>")
+        assert self.mock_detector.detect_prompt.call_count == 2
+        self.mock_detector.detect_prompt.assert_called_with("A>")
 
-        with patch("sys.stderr") as mock_stderr:
-            self.processor._debug_received_data("test data")
+    def test_process_data_instant_mode_skips_detection_during_echo(self):
+        """Test prompt detection is skipped until the command echo is consumed"""
+        self.processor.set_instant_mode(True)
+        self.processor.set_last_command("DIR>")
+        self.mock_detector.detect_prompt.return_value = False
 
-        # Verify that print was called with the expected debug message
-        # Check if print was called (via the mock)
-        assert mock_stderr.write.called or hasattr(mock_stderr, "write")
+        for char in "DIR":
+            self.processor.process_data(char)
+        self.mock_detector.detect_prompt.assert_not_called()
 
-    def test_debug_received_data_without_debug_mode(self):
-        """Test debug output when debug mode is disabled"""
-        # Don't set debug_mode attribute
+        self.processor.process_data(">")
+        assert self.processor.echo_suppressed is True
+        self.mock_detector.detect_prompt.assert_called_once()
 
-        with patch("sys.stderr") as mock_stderr:
-            self.processor._debug_received_data("test data")
+    def test_process_data_instant_mode_detects_prompt_without_echo(self):
+        """Test prompt is detected on the prompt chunk for input that is not echoed"""
+        processor = DataProcessor(MSXProtocolDetector(), instant_mode=True)
+        # ^Cは\x03として送られ、エコーされない
+        processor.set_last_command("^C")
 
-        # Should not call print when debug_mode is not set
-        assert not mock_stderr.write.called
+        processor.process_data("Break in 10\r\n")
+        result = processor.process_data("Ok")
+
+        assert result[-1] == ("", True)
+        assert processor.buffer.get_content() == ""
+
+    def test_process_data_instant_mode_char_by_char_prompts(self):
+        """Test instant mode detects prompts fed one character at a time"""
+        processor = DataProcessor(MSXProtocolDetector(), instant_mode=True)
+
+        for text in ["A>", "Ok", "READY", "?Redo from start"]:
+            results = [processor.process_data(char) for char in "\r\n" + text]
+            assert results[-1][-1] == ("", True)
+            assert processor.buffer.get_content() == ""
+
+    def test_process_data_instant_mode_with_echo_suppression(self):
+        """Test processing data in instant mode with echo suppression"""
+        self.processor.set_instant_mode(True)
+        self.processor.set_last_command("LIST")
+        self.processor.echo_suppressed = True
+        self.mock_detector.detect_prompt.return_value = False
+
+        result = self.processor.process_data("some output")
+
+        assert result == [("some output", False)]
 
     def test_should_suppress_echo_true(self):
         """Test echo suppression detection - should suppress"""
@@ -220,6 +324,38 @@ class TestDataProcessor:
         result = self.processor._should_suppress_echo("Some other output")
         assert result is False
 
+    def test_should_suppress_echo_split_across_chunks(self):
+        """Test echo detection when the command arrives in pieces"""
+        self.processor.set_last_command("LIST")
+
+        assert self.processor._should_suppress_echo("xxLI") is False
+        assert self.processor._should_suppress_echo("xxLIS") is False
+        assert self.processor._should_suppress_echo("xxLIST") is True
+        assert self.processor._echo_match_pos == 2
+
+    def test_should_suppress_echo_after_buffer_clear(self):
+        """Test echo search restarts after the buffer is cleared"""
+        self.processor.set_last_command("RUN")
+        self.processor.buffer.add_data("noise" * 10)
+        content = self.processor.buffer.get_content()
+        assert self.processor._should_suppress_echo(content) is False
+
+        self.processor.buffer.clear()
+        self.processor.buffer.add_data("RUN" + "x" * 60)
+        content = self.processor.buffer.get_content()
+        assert self.processor._should_suppress_echo(content) is True
+
+    def test_process_echo_suppression_uses_match_position(self):
+        """Test echo suppression reuses the position found by the check"""
+        self.processor.set_last_command("LIST")
+        self.processor.buffer.add_data("> LIST\r\nOutput")
+        content = self.processor.buffer.get_content()
+
+        assert self.processor._should_suppress_echo(content) is True
+        self.processor._process_echo_suppression(content)
+
+        assert self.processor.buffer.get_content() == "Output"
+
     def test_process_echo_suppression_with_remaining_content(self):
         """Test echo suppression processing with remaining content"""
         self.processor.set_last_command("LIST")
@@ -258,6 +394,21 @@ class TestDataProcessor:
         assert self.processor._is_likely_prompt("C:>") is True
         assert self.processor._is_likely_prompt("H>") is True
 
+    def test_is_likely_prompt_drive_prompt_without_regex(self):
+        """Test drive prompts are recognized before the regex is consulted"""
+        assert self.processor._is_likely_prompt(" A>\r\n") is True
+        assert self.processor._is_likely_prompt("b:>") is True
+        self.mock_detector.unified_prompt_pattern.search.assert_not_called()
+
+    def test_is_drive_prompt(self):
+        """Test drive prompt helper against the unified pattern"""
+        detector = MSXProtocolDetector()
+        for content in ["A>", "Z:>", "a>", "1>", "A:", "AB>", ">", "", "A:>x", "?>"]:
+            expected = bool(detector.unified_prompt_pattern.search(content)) and (
+                content.endswith(">")
+            )
+            assert _is_drive_prompt(content) is expected
+
     def test_is_likely_prompt_basic_ok(self):
         """Test prompt pattern detection for BASIC Ok"""
         # Mock the unified pattern to return True for Ok
@@ -292,9 +443,9 @@ class TestDataProcessor:
         assert self.processor._is_likely_prompt("A") is False
         assert self.processor._is_likely_prompt("") is False
 
-    def test_get_prompt_patterns(self):
-        """Test getting prompt patterns"""
-        patterns = self.processor._get_prompt_patterns()
+    def test_prompt_patterns(self):
+        """Test module-level prompt pattern list"""
+        patterns = list(PROMPT_PATTERNS)
 
         # A-Zの全ドライブ（通常とコロン付き）に対応
         expected_patterns = []
@@ -321,6 +472,21 @@ class TestDataProcessor:
         content = "Some random text without keywords"
         assert self.processor._has_basic_keywords(content) is False
 
+    def test_has_basic_keywords_custom_keywords(self):
+        """Test BASIC keyword detection with configured keywords"""
+        with patch("msx_serial.core.data_processor.ConfigManager") as mock_config:
+            mock_config.return_value.get.return_value = ["Disk BASIC (1.0)"]
+            processor = DataProcessor(self.mock_detector)
+        assert processor._has_basic_keywords("disk basic (1.0)\nOk") is True
+        assert processor._has_basic_keywords("Disk BASIC 1.0") is False
+
+    def test_has_basic_keywords_empty_keywords(self):
+        """Test BASIC keyword detection without configured keywords"""
+        with patch("msx_serial.core.data_processor.ConfigManager") as mock_config:
+            mock_config.return_value.get.return_value = []
+            processor = DataProcessor(self.mock_detector)
+        assert processor._has_basic_keywords("Microsoft BASIC") is False
+
     def test_check_timeout_instant_mode_with_prompt(self):
         """Test timeout check in instant mode with prompt"""
         self.processor.set_instant_mode(True)
@@ -533,6 +699,20 @@ class TestDataProcessor:
         result = self.processor.has_incomplete_data()
         assert result is False
 
+    def test_has_incomplete_data_tracks_chunks(self):
+        """Test incomplete data detection across chunks, clear and set_content"""
+        self.processor.buffer.add_data("")
+        assert self.processor.has_incomplete_data() is False
+        self.processor.buffer.add_data("  ")
+        assert self.processor.has_incomplete_data() is True
+        self.processor.buffer.add_data("line\n")
+        self.processor.buffer.add_data("A")
+        assert self.processor.has_incomplete_data() is False
+        self.processor.buffer.set_content("A>")
+        assert self.processor.has_incomplete_data() is True
+        self.processor.buffer.clear()
+        assert self.processor.has_incomplete_data() is False
+
 
 def test_process_echo_suppression_else_branch():
     from unittest.mock import Mock
@@ -606,23 +786,6 @@ def test_data_processor_exception_handling():
     assert processor.buffer.get_content() == "test data"
 
 
-def test_data_processor_debug_mode():
-    """Test debug mode functionality"""
-    from unittest.mock import Mock, patch
-
-    from msx_serial.core.data_processor import DataProcessor
-
-    mock_detector = Mock()
-    mock_detector.debug_mode = True
-    processor = DataProcessor(mock_detector)
-
-    # デバッグモードでの動作を確認
-    with patch("sys.stderr") as mock_stderr:
-        processor._debug_received_data("debug test")
-        # デバッグ出力が削除されていることを確認（実装の変更に合わせて）
-        assert not mock_stderr.write.called
-
-
 def test_data_processor_echo_suppression_edge_cases():
     """Test edge cases in echo suppression"""
     from unittest.mock import Mock
@@ -701,13 +864,13 @@ def test_data_processor_timeout_operations():
 
     # タイムアウトのテスト
     processor.buffer.add_data("test")
-    with patch("time.time", return_value=time.time() + 1.0):
+    with patch("time.monotonic", return_value=time.monotonic() + 1.0):
         result = processor.buffer.is_timeout(0.5)
         assert result is True
 
     # タイムアウトしていない場合
     processor.buffer.add_data("test2")
-    with patch("time.time", return_value=time.time() + 0.1):
+    with patch("time.monotonic", return_value=time.monotonic() + 0.1):
         result = processor.buffer.is_timeout(0.5)
         assert result is False
 
@@ -771,6 +934,9 @@ class TestDIRAutoCache:
     def test_dir_auto_cache_on_prompt(self):
         """Test automatic cache update when prompt is detected"""
         self.processor.set_last_command("DIR")
+        # Command echo arrives first
+        self.mock_detector.detect_prompt.return_value = False
+        self.processor._process_data_instant("DIR\r\n")
         self.processor.dos_collector.process_output("TEST.BAS    1024\n")
 
         # Simulate prompt detection
@@ -782,6 +948,34 @@ class TestDIRAutoCache:
         self.mock_dos_manager.parse_dir_output.assert_called_once()
         assert not self.processor.dos_collector.is_collecting
 
+    def test_dir_auto_cache_without_echo(self):
+        """Test cache update on the prompt chunk when the command echo never arrives"""
+        self.processor.set_instant_mode(True)
+        self.processor.set_last_command("DIR")
+        self.mock_detector.detect_prompt.return_value = True
+
+        result = self.processor.process_data("TEST.BAS    1024\nA>")
+
+        assert result[-1] == ("", True)
+        self.mock_dos_manager.parse_dir_output.assert_called_once()
+        assert not self.processor.dos_collector.is_collecting
+
+    def test_dir_auto_cache_on_timeout_without_echo_or_newline(self):
+        """Test cache update via timeout when neither echo nor a newline arrives"""
+        self.processor.set_instant_mode(True)
+        self.processor.set_last_command("DIR")
+        self.mock_detector.detect_prompt.return_value = True
+
+        self.processor.process_data("A>")
+        self.mock_dos_manager.parse_dir_output.assert_not_called()
+
+        with patch.object(self.processor.buffer, "is_timeout", return_value=True):
+            result = self.processor.check_timeout(0.1)
+
+        assert result == ("", True)
+        self.mock_dos_manager.parse_dir_output.assert_called_once()
+        assert not self.processor.dos_collector.is_collecting
+
     def test_non_dir_command_no_collection(self):
         """Test that non-DIR commands don't trigger collection"""
         self.processor.set_last_command("TYPE test.bas")
@@ -24,21 +24,18 @@ class TestTerminalDisplay:
         display = TerminalDisplay("#ff0000")
         assert display.receive_color == "#ff0000"
 
-    @patch("subprocess.run")
-    def test_clear_screen_unix(self, mock_run):
-        """Test clear screen on Unix systems"""
-        with patch("sys.platform", "linux"):
+    def test_clear_screen(self):
+        """Test clear screen writes the ANSI clear sequence"""
+        with patch("sys.stdout") as mock_stdout:
             self.display.clear_screen()
-            mock_run.assert_called_once_with(["clear"], check=False, timeout=5)
+        mock_stdout.write.assert_called_once_with("\x1b[2J\x1b[H")
+        mock_stdout.flush.assert_called_once()
 
-    @patch("subprocess.run")
-    def test_clear_screen_windows(self, mock_run):
-        """Test clear screen on Windows"""
-        with patch("sys.platform", "win32"):
+    def test_clear_screen_write_error(self):
+        """Test clear screen ignores output errors"""
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.write.side_effect = OSError()
             self.display.clear_screen()
-            mock_run.assert_called_once_with(
-                ["cmd", "/c", "cls"], check=False, timeout=5
-            )
 
     @patch("msx_serial.display.basic_display.print_formatted_text")
     def test_print_receive_regular(self, mock_print):
@@ -111,3 +108,30 @@ class TestTerminalDisplay:
             mock_size.side_effect = OSError()
             result = self.display._wrap_text_if_needed("test")
             assert result == "test"
+
+    def test_terminal_width_cached(self):
+        """Test terminal width is queried once within the cache period"""
+        with patch("os.get_terminal_size") as mock_size:
+            mock_size.return_value = Mock(columns=5)
+            with patch(
+                "msx_serial.display.basic_display.time.monotonic", return_value=100.0
+            ):
+                self.display._wrap_text_if_needed("verylongtext")
+                mock_size.return_value = Mock(columns=50)
+                result = self.display._wrap_text_if_needed("verylongtext")
+            assert result == "veryl\nongte\nxt"
+            mock_size.assert_called_once()
+
+    def test_terminal_width_refreshed_after_ttl(self):
+        """Test terminal width is queried again after the cache period"""
+        with patch("os.get_terminal_size") as mock_size:
+            mock_size.return_value = Mock(columns=5)
+            with patch(
+                "msx_serial.display.basic_display.time.monotonic",
+                side_effect=[100.0, 101.0],
+            ):
+                self.display._wrap_text_if_needed("verylongtext")
+                mock_size.return_value = Mock(columns=50)
+                result = self.display._wrap_text_if_needed("verylongtext")
+            assert result == "verylongtext"
+            assert mock_size.call_count == 2
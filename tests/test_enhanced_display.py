@@ -11,19 +11,16 @@ class TestEnhancedTerminalDisplay:
     def setup_method(self):
         self.display = EnhancedTerminalDisplay()
 
-    @patch("subprocess.run")
-    def test_clear_screen_windows(self, mock_run):
-        with patch("sys.platform", "win32"):
+    def test_clear_screen(self):
+        with patch("sys.stdout") as mock_stdout:
             self.display.clear_screen()
-            mock_run.assert_called_once_with(
-                ["cmd", "/c", "cls"], check=False, timeout=5
-            )
+        mock_stdout.write.assert_called_once_with("\x1b[2J\x1b[H")
+        mock_stdout.flush.assert_called_once()
 
-    @patch("subprocess.run")
-    def test_clear_screen_unix(self, mock_run):
-        with patch("sys.platform", "linux"):
+    def test_clear_screen_write_error(self):
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.write.side_effect = OSError()
             self.display.clear_screen()
-            mock_run.assert_called_once_with(["clear"], check=False, timeout=5)
 
     def test_print_receive_regular(self):
         with patch.object(self.display, "_write_instant") as mock_write:
@@ -70,6 +67,19 @@ class TestEnhancedTerminalDisplay:
             self.display._write_instant("test")
             assert self.display.stats["instant_writes"] == 2
 
+    def test_total_bytes_displayed(self):
+        with patch("sys.stdout"):
+            self.display.print_receive("abc")
+            assert self.display.total_bytes_displayed == 3
+            # 非ASCII文字はUTF-8のバイト数で数える
+            self.display.print_receive("\u3042")
+            assert self.display.total_bytes_displayed == 6
+
+    def test_stats_returns_snapshot(self):
+        stats = self.display.get_performance_stats()
+        stats["instant_writes"] = 10
+        assert self.display.stats["instant_writes"] == 0
+
     def test_initialization(self):
         """Test proper initialization"""
         assert hasattr(self.display, "last_output_time")
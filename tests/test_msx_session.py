@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import MagicMock, Mock, call, patch
 
 from msx_serial.connection.dummy import DummyConfig, DummyConnection
-from msx_serial.core.msx_session import MSXSession
+from msx_serial.core.msx_session import MAX_READ_SIZE, MSXSession
 from msx_serial.protocol.msx_detector import MSXMode
 
 
@@ -39,7 +39,6 @@ class TestMSXSession(unittest.TestCase):
     def test_init_performance_settings(self) -> None:
         """パフォーマンス設定の初期値テスト"""
         self.assertEqual(self.session.receive_delay, 0.0001)
-        self.assertEqual(self.session.batch_size, 1)
         self.assertEqual(self.session.timeout_check_interval, 0.01)
 
     def test_init_components(self) -> None:
@@ -155,6 +154,60 @@ class TestMSXSession(unittest.TestCase):
             self.assertGreater(self.session.last_data_time, 0)
             mock_display.assert_called_once_with("text", False)
 
+    def test_process_incoming_data_reads_waiting_bytes(self) -> None:
+        """受信済みバイトをまとめて読み込むテスト"""
+        self.session.connection.in_waiting = Mock(return_value=3)
+        self.session.connection.read = Mock(return_value=b"A>\n")
+        self.session.data_processor.process_data = Mock(return_value=[])
+
+        self.assertTrue(self.session._process_incoming_data())
+        self.session.connection.read.assert_called_once_with(3)
+        self.session.data_processor.process_data.assert_called_once()
+        self.assertEqual(
+            self.session.data_processor.process_data.call_args[0][0], "A>\n"
+        )
+
+    def test_process_incoming_data_read_capped(self) -> None:
+        """読み込みサイズがMAX_READ_SIZEで制限されるテスト"""
+        self.session.connection.in_waiting = Mock(return_value=MAX_READ_SIZE + 100)
+        self.session.connection.read = Mock(return_value=b"A")
+        self.session.data_processor.process_data = Mock(return_value=[])
+
+        self.session._process_incoming_data()
+        self.session.connection.read.assert_called_once_with(MAX_READ_SIZE)
+
+    def test_process_incoming_data_split_multibyte_char(self) -> None:
+        """読み込み境界で分割された2バイト文字のテスト"""
+        self.session.connection.in_waiting = Mock(return_value=1)
+        self.session.connection.read = Mock(side_effect=[b"\x01", b"\x41"])
+        self.session.data_processor.process_data = Mock(return_value=[])
+
+        self.assertTrue(self.session._process_incoming_data())
+        self.session.data_processor.process_data.assert_not_called()
+
+        self.assertTrue(self.session._process_incoming_data())
+        self.session.data_processor.process_data.assert_called_once()
+        self.assertEqual(
+            self.session.data_processor.process_data.call_args[0][0],
+            b"\x01\x41".decode("msx-jp"),
+        )
+
+    def test_process_incoming_data_invalid_bytes_replaced(self) -> None:
+        """不正なバイトを含むチャンクも置換して処理するテスト"""
+        with (
+            patch("msx_serial.completion.iot_loader.IotNodes"),
+            patch("msx_serial.io.input_session.PromptSession"),
+        ):
+            session = MSXSession(connection=self.connection, encoding="utf-8")
+        session.connection.in_waiting = Mock(return_value=4)
+        session.connection.read = Mock(return_value=b"A\xff>\n")
+        session.data_processor.process_data = Mock(return_value=[])
+
+        self.assertTrue(session._process_incoming_data())
+        self.assertEqual(
+            session.data_processor.process_data.call_args[0][0], "A\ufffd>\n"
+        )
+
     def test_process_incoming_data_empty_read(self) -> None:
         """空のreadの場合の_process_incoming_dataテスト"""
         self.session.connection.in_waiting = Mock(return_value=1)
@@ -163,22 +216,6 @@ class TestMSXSession(unittest.TestCase):
         result = self.session._process_incoming_data()
         self.assertFalse(result)
 
-    def test_process_incoming_data_decode_error(self) -> None:
-        """デコードエラーの場合の_process_incoming_dataテスト"""
-        self.session.connection.in_waiting = Mock(return_value=1)
-        # Create a mock that raises UnicodeDecodeError when read
-        mock_data = Mock()
-        mock_data.decode.side_effect = UnicodeDecodeError(
-            "msx-jp", b"\xff", 0, 1, "invalid start byte"
-        )
-        self.session.connection.read = Mock(return_value=mock_data)
-
-        with patch("msx_serial.core.msx_session.print_exception") as mock_print_exc:
-            result = self.session._process_incoming_data()
-
-            self.assertFalse(result)
-            mock_print_exc.assert_called_once()
-
     def test_process_incoming_data_suppressed_output(self) -> None:
         """出力が抑制されている場合のテスト"""
         self.session.suppress_output = True
@@ -191,6 +228,19 @@ class TestMSXSession(unittest.TestCase):
             self.assertTrue(result)
             mock_display.assert_not_called()
 
+    def test_process_incoming_data_passes_receive_time(self) -> None:
+        """ループで取得した時刻がそのまま使われるテスト"""
+        self.session.connection.in_waiting = Mock(return_value=1)
+        self.session.connection.read = Mock(return_value=b"A")
+        self.session.data_processor.process_data = Mock(return_value=[])
+
+        with patch("time.monotonic") as mock_monotonic:
+            self.session._process_incoming_data(12.5)
+            mock_monotonic.assert_not_called()
+
+        self.assertEqual(self.session.last_data_time, 12.5)
+        self.session.data_processor.process_data.assert_called_once_with("A", 12.5)
+
     def test_check_timeouts_suppressed_output(self) -> None:
         """出力が抑制されている場合の_check_timeoutsテスト"""
         self.session.suppress_output = True
@@ -200,6 +250,7 @@ class TestMSXSession(unittest.TestCase):
     def test_check_timeouts_normal_timeout(self) -> None:
         """通常のタイムアウト処理テスト"""
         # タイムアウト結果をモック
+        self.session.data_processor.buffer.add_data("timeout_text")
         self.session.data_processor.check_timeout = Mock(
             return_value=("timeout_text", True)
         )
@@ -211,6 +262,7 @@ class TestMSXSession(unittest.TestCase):
     def test_check_timeouts_prompt_candidate(self) -> None:
         """プロンプト候補タイムアウト処理テスト"""
         # プロンプト候補結果をモック
+        self.session.data_processor.buffer.add_data("prompt_text")
         self.session.data_processor.check_timeout = Mock(return_value=None)
         self.session.data_processor.check_prompt_candidate = Mock(
             return_value=("prompt_text", True)
@@ -220,6 +272,16 @@ class TestMSXSession(unittest.TestCase):
             self.session._check_timeouts()
             mock_display.assert_called_with("prompt_text", True)
 
+    def test_check_timeouts_empty_buffer(self) -> None:
+        """バッファが空の場合は各チェックを呼ばないテスト"""
+        self.session.data_processor.check_timeout = Mock(return_value=None)
+        self.session.data_processor.check_prompt_candidate = Mock(return_value=None)
+
+        self.session._check_timeouts()
+
+        self.session.data_processor.check_timeout.assert_not_called()
+        self.session.data_processor.check_prompt_candidate.assert_not_called()
+
     def test_check_timeouts_buffer_content(self) -> None:
         """バッファコンテンツ処理テスト"""
         # バッファの状態をモック
@@ -248,6 +310,7 @@ class TestMSXSession(unittest.TestCase):
             "MSX BASIC version 2.0 Ok",
             "Copyright (C) 1985 Microsoft Ok",
             "BASIC 2.0 Ok",
+            "msx basic Ok\r\n",
         ]
 
         for content in test_cases:
@@ -262,6 +325,7 @@ class TestMSXSession(unittest.TestCase):
             "Ok",  # BASICキーワードがない
             "Microsoft",  # Okで終わらない
             "Some other text Ok",  # BASICキーワードがない
+            "microsoft copyright Ok",  # Microsoft/Copyrightは大文字小文字を区別する
         ]
 
         for content in test_cases:
@@ -427,7 +491,7 @@ class TestMSXSession(unittest.TestCase):
 
         mock_print_exception.assert_called_with("Input error", test_exception)
 
-    @patch("time.time")
+    @patch("time.monotonic")
     @patch("time.sleep")
     @patch("msx_serial.core.msx_session.print_exception")
     def test_receive_loop_normal_operation(
@@ -453,7 +517,7 @@ class TestMSXSession(unittest.TestCase):
         # _process_incoming_dataのモック（最初はデータなし、その後停止）
         process_call_count = 0
 
-        def process_data_side_effect():
+        def process_data_side_effect(now=None):
             nonlocal process_call_count
             process_call_count += 1
             if process_call_count >= 3:  # 3回目で停止
@@ -493,7 +557,7 @@ class TestMSXSession(unittest.TestCase):
         """受信ループの適応的遅延テスト"""
         call_count = 0
 
-        def mock_process_data():
+        def mock_process_data(now=None):
             nonlocal call_count
             call_count += 1
             if call_count <= 3:
@@ -520,10 +584,10 @@ class TestMSXSession(unittest.TestCase):
         """長時間のデータなし状態での適応的遅延テスト"""
         call_count = 0
 
-        def mock_process_data():
+        def mock_process_data(now=None):
             nonlocal call_count
             call_count += 1
-            if call_count <= 7:  # 5回以上空読み込みをシミュレート
+            if call_count <= 7:
                 return False  # データなし
             else:
                 self.session.stop_event.set()
@@ -537,21 +601,82 @@ class TestMSXSession(unittest.TestCase):
         ):
             self.session._receive_loop()
 
-            # sleepが異なる値で呼ばれることを確認
-            sleep_calls = mock_sleep.call_args_list
-            self.assertTrue(
-                any(call[0][0] == 0.0001 for call in sleep_calls)
-            )  # 初期の短い遅延
-            self.assertTrue(
-                any(call[0][0] == 0.001 for call in sleep_calls)
-            )  # 長期間後の遅延
+            # 受信がなければ上限の間隔でポーリングすることを確認
+            sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+            self.assertTrue(sleep_calls)
+            self.assertTrue(all(delay == 0.001 for delay in sleep_calls))
+
+    def test_poll_interval(self) -> None:
+        """受信間隔に応じたポーリング間隔のテスト"""
+        # 受信直後で受信間隔が短い場合はreceive_delayまで短くする
+        self.assertEqual(self.session._poll_interval(0.0, 0.00005), 0.0001)
+        # 受信が続いている間は受信間隔の半分
+        self.assertAlmostEqual(self.session._poll_interval(0.0, 0.0006), 0.0003)
+        # 無受信が続くと上限まで延ばす
+        self.assertAlmostEqual(self.session._poll_interval(0.0008, 0.0001), 0.0004)
+        self.assertEqual(self.session._poll_interval(5.0, 0.0001), 0.001)
+
+    def test_get_connection_fd(self) -> None:
+        """接続のファイルディスクリプタ取得テスト"""
+        # DummyConnectionはfilenoを持たない
+        self.assertIsNone(self.session._fd)
+
+        self.session.connection = Mock()
+        self.session.connection.fileno.return_value = 5
+        self.assertEqual(self.session._get_connection_fd(), 5)
+
+        self.session.connection.fileno.side_effect = OSError
+        self.assertIsNone(self.session._get_connection_fd())
+
+    @patch("msx_serial.core.msx_session.select.select")
+    @patch("time.sleep")
+    def test_receive_loop_waits_on_fd(
+        self, mock_sleep: MagicMock, mock_select: MagicMock
+    ) -> None:
+        """ファイルディスクリプタがある場合はselectで待機するテスト"""
+        self.session._fd = 5
+        mock_select.return_value = ([], [], [])
+        call_count = 0
+
+        def mock_process_data(now=None):
+            nonlocal call_count
+            call_count += 1
+            if call_count >= 3:
+                self.session.stop_event.set()
+            return False
+
+        with (
+            patch.object(
+                self.session, "_process_incoming_data", side_effect=mock_process_data
+            ),
+            patch.object(self.session, "_check_timeouts"),
+        ):
+            self.session._receive_loop()
+
+        self.assertEqual(mock_select.call_count, 3)
+        args = mock_select.call_args[0]
+        self.assertEqual(args[0], [5])
+        self.assertLessEqual(args[3], self.session.timeout_check_interval)
+        mock_sleep.assert_not_called()
+
+    @patch("msx_serial.core.msx_session.select.select")
+    @patch("time.sleep")
+    def test_wait_for_data_closed_fd(
+        self, mock_sleep: MagicMock, mock_select: MagicMock
+    ) -> None:
+        """待機中に接続が閉じられた場合のテスト"""
+        mock_select.side_effect = OSError
+
+        self.session._wait_for_data(5, 0.01)
+
+        mock_sleep.assert_called_once_with(0.001)
 
     @patch("time.sleep")
     def test_receive_loop_data_then_no_data(self, mock_sleep: MagicMock) -> None:
         """データありからデータなしへの遷移テスト"""
         call_count = 0
 
-        def mock_process_data():
+        def mock_process_data(now=None):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -567,11 +692,11 @@ class TestMSXSession(unittest.TestCase):
                 self.session, "_process_incoming_data", side_effect=mock_process_data
             ),
             patch.object(self.session, "_check_timeouts"),
+            patch("time.monotonic", return_value=100.0),
         ):
             self.session._receive_loop()
 
-            # データありの場合、consecutive_empty_readsがリセットされ、
-            # その後のデータなしで短い遅延が使われることを確認
+            # データ受信直後のデータなしでは短い遅延が使われることを確認
             sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
             self.assertIn(0.0001, sleep_calls)  # 短い遅延が使われている
 
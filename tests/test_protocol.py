@@ -195,6 +195,21 @@ def test_detect_prompt_multiline_false():
     assert detector.detect_prompt(multi) is False
 
 
+def test_detect_prompt_multiline_dos_any_line():
+    detector = MSXProtocolDetector()
+    assert detector.detect_prompt("Hello\n  B> \r\nWorld") is True
+    assert detector.detect_prompt("Hello\nx A>\nWorld") is False
+    assert detector.detect_prompt("Hello\na>\nWorld") is False
+
+
+def test_detect_prompt_no_debug_output_when_disabled():
+    detector = MSXProtocolDetector()
+    with patch.object(detector, "_debug_print") as mock_debug:
+        assert detector.detect_prompt("Hello\nWorld") is False
+        assert detector.detect_prompt("Hello\nOk") is True
+    mock_debug.assert_not_called()
+
+
 def test_detect_mode_multiline_unknown():
     detector = MSXProtocolDetector()
     multi = "Hello\nWorld"
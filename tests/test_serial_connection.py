@@ -112,6 +112,50 @@ class TestSerialConnection(unittest.TestCase):
         mock_serial_instance.read.assert_called_once_with(10)
         self.assertEqual(result, b"response")
 
+    @patch("msx_serial.connection.serial.os.read")
+    @patch("msx_serial.connection.serial.serial.Serial")
+    def test_read_from_fd(self, mock_serial, mock_os_read):
+        """ファイルディスクリプタから直接読み込むテスト"""
+        mock_serial_instance = Mock()
+        mock_serial_instance.fileno.return_value = 7
+        mock_serial.return_value = mock_serial_instance
+        mock_os_read.return_value = b"A>"
+
+        connection = SerialConnection(self.config)
+        result = connection.read(10)
+
+        mock_os_read.assert_called_once_with(7, 10)
+        mock_serial_instance.read.assert_not_called()
+        self.assertEqual(result, b"A>")
+        self.assertEqual(connection.fileno(), 7)
+
+    @patch("msx_serial.connection.serial.os.read")
+    @patch("msx_serial.connection.serial.serial.Serial")
+    def test_read_from_fd_no_data(self, mock_serial, mock_os_read):
+        """受信データがない場合は空を返すテスト"""
+        mock_serial_instance = Mock()
+        mock_serial_instance.fileno.return_value = 7
+        mock_serial.return_value = mock_serial_instance
+        mock_os_read.side_effect = BlockingIOError
+
+        connection = SerialConnection(self.config)
+
+        self.assertEqual(connection.read(10), b"")
+
+    @patch("msx_serial.connection.serial.serial.Serial")
+    def test_read_without_fileno(self, mock_serial):
+        """filenoがない環境ではpyserialで読み込むテスト"""
+        mock_serial_instance = Mock()
+        mock_serial_instance.fileno.side_effect = AttributeError
+        mock_serial_instance.read.return_value = b"response"
+        mock_serial.return_value = mock_serial_instance
+
+        connection = SerialConnection(self.config)
+
+        self.assertEqual(connection.read(10), b"response")
+        mock_serial_instance.read.assert_called_once_with(10)
+        self.assertIsNone(connection.fileno())
+
     @patch("msx_serial.connection.serial.serial.Serial")
     def test_in_waiting(self, mock_serial):
         """受信待ちバイト数のテスト"""
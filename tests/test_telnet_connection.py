@@ -5,6 +5,16 @@ from unittest.mock import MagicMock, Mock, patch
 from msx_serial.connection.telnet import TelnetConfig, TelnetConnection
 
 
+def _recv_into_returning(data: bytes):
+    """recv_intoの動作を模倣するside_effectを生成"""
+
+    def recv_into(buffer, nbytes=0):
+        buffer[: len(data)] = data
+        return len(data)
+
+    return recv_into
+
+
 class TestTelnetConfig(unittest.TestCase):
     """TelnetConfigのテスト"""
 
@@ -121,7 +131,7 @@ class TestTelnetConnection(unittest.TestCase):
     ) -> None:
         """バッファ補充を伴う読み込みテスト"""
         mock_socket = Mock()
-        mock_socket.recv.return_value = b"new data"
+        mock_socket.recv_into.side_effect = _recv_into_returning(b"new data")
         mock_socket_class.return_value = mock_socket
         mock_select.return_value = ([mock_socket], [], [])  # データあり
 
@@ -130,7 +140,31 @@ class TestTelnetConnection(unittest.TestCase):
 
         data = connection.read(8)
         self.assertEqual(data, b"new data")
-        mock_socket.recv.assert_called_with(4096)
+        self.assertEqual(mock_socket.recv_into.call_args[0][1], 4096)
+
+    @patch("socket.socket")
+    @patch("select.select")
+    def test_read_consumes_across_fills(
+        self, mock_select: MagicMock, mock_socket_class: MagicMock
+    ) -> None:
+        """複数回の受信と部分読み込みが順序通りに行われるテスト"""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+        mock_select.return_value = ([mock_socket], [], [])
+
+        chunks = iter([b"abc", b"defg"])
+
+        def recv_into(buffer, nbytes=0):
+            return _recv_into_returning(next(chunks))(buffer, nbytes)
+
+        mock_socket.recv_into.side_effect = recv_into
+
+        connection = TelnetConnection(TelnetConfig())
+
+        self.assertEqual(connection.read(2), b"ab")
+        self.assertEqual(connection.read(3), b"cde")
+        self.assertEqual(connection.read(2), b"fg")
+        self.assertEqual(len(connection._buffer), 0)
 
     @patch("socket.socket")
     @patch("msx_serial.connection.telnet.print_exception")
@@ -177,7 +211,7 @@ class TestTelnetConnection(unittest.TestCase):
     ) -> None:
         """接続が閉じられた場合のバッファ補充テスト"""
         mock_socket = Mock()
-        mock_socket.recv.return_value = b""  # 空のデータ = 接続終了
+        mock_socket.recv_into.return_value = 0  # 受信0バイト = 接続終了
         mock_socket_class.return_value = mock_socket
         mock_select.return_value = ([mock_socket], [], [])
 
@@ -197,7 +231,7 @@ class TestTelnetConnection(unittest.TestCase):
         mock_socket = Mock()
         mock_socket_class.return_value = mock_socket
         mock_select.return_value = ([mock_socket], [], [])
-        mock_socket.recv.side_effect = socket.error("Network error")
+        mock_socket.recv_into.side_effect = socket.error("Network error")
 
         config = TelnetConfig()
         connection = TelnetConnection(config)
@@ -212,7 +246,7 @@ class TestTelnetConnection(unittest.TestCase):
     ) -> None:
         """データが利用可能な場合のin_waitingテスト"""
         mock_socket = Mock()
-        mock_socket.recv.return_value = b"waiting data"
+        mock_socket.recv_into.side_effect = _recv_into_returning(b"waiting data")
         mock_socket_class.return_value = mock_socket
         mock_select.return_value = ([mock_socket], [], [])
 
@@ -223,6 +257,17 @@ class TestTelnetConnection(unittest.TestCase):
         self.assertEqual(result, 12)  # "waiting data"の長さ
         self.assertEqual(connection._buffer, bytearray(b"waiting data"))
 
+    @patch("socket.socket")
+    def test_fileno(self, mock_socket_class: MagicMock) -> None:
+        """ソケットのファイルディスクリプタを返すテスト"""
+        mock_socket = Mock()
+        mock_socket.fileno.return_value = 9
+        mock_socket_class.return_value = mock_socket
+
+        connection = TelnetConnection(TelnetConfig())
+
+        self.assertEqual(connection.fileno(), 9)
+
     @patch("socket.socket")
     @patch("select.select")
     def test_in_waiting_no_data(
@@ -246,7 +291,7 @@ class TestTelnetConnection(unittest.TestCase):
     ) -> None:
         """接続が閉じられた場合のin_waitingテスト"""
         mock_socket = Mock()
-        mock_socket.recv.return_value = b""  # 空 = 接続終了
+        mock_socket.recv_into.return_value = 0  # 0バイト = 接続終了
         mock_socket_class.return_value = mock_socket
         mock_select.return_value = ([mock_socket], [], [])
 
@@ -35,6 +35,13 @@ class TestMSXTerminalWithDummy(unittest.TestCase):
         data = self.conn.get_sent_data()
         self.assertIn(b"TEST", data[0])
 
+    def test_sent_data_chunks(self) -> None:
+        """複数回の送信がチャンク単位で取得できることのテスト"""
+        self.conn.write(b"AB")
+        self.conn.write(b"")
+        self.conn.write(b"CDE")
+        self.assertEqual(self.conn.get_sent_data(), [b"AB", b"", b"CDE"])
+
     def test_exit_command(self) -> None:
         """終了コマンドのテスト"""
         stop_event = self.terminal.stop_event
@@ -2,10 +2,13 @@
 Tests for URI parsing utilities
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from msx_serial.connection.uri_parser import (LegacyFormatParser, ParsedUri,
-                                              StandardUriParser, UriParser)
+                                              StandardUriParser, UriParser,
+                                              normalize_scheme)
 
 
 class TestParsedUri:
@@ -37,6 +40,22 @@ class TestParsedUri:
         assert uri.query_params == params
 
 
+class TestNormalizeScheme:
+    """Test scheme normalization"""
+
+    def test_known_schemes(self):
+        """Test known scheme variants are lowercased"""
+        assert normalize_scheme("telnet") == "telnet"
+        assert normalize_scheme("TELNET") == "telnet"
+        assert normalize_scheme("Serial") == "serial"
+        assert normalize_scheme("DUMMY") == "dummy"
+
+    def test_unknown_scheme_fallback(self):
+        """Test unusual casing falls back to str.lower()"""
+        assert normalize_scheme("TeLnEt") == "telnet"
+        assert normalize_scheme("HTTP") == "http"
+
+
 class TestLegacyFormatParser:
     """Test legacy format parser"""
 
@@ -79,6 +98,17 @@ class TestLegacyFormatParser:
         result = LegacyFormatParser.parse_host_port("localhost:invalid")
         assert result is None
 
+    def test_parse_host_port_ipv6(self):
+        """Test IPv6 address uses the last colon as port separator"""
+        result = LegacyFormatParser.parse_host_port("fe80::1:2323")
+        assert result is not None
+        assert result.host == "fe80::1"
+        assert result.port == 2323
+
+    def test_parse_host_port_ipv6_without_port(self):
+        """Test IPv6 address whose last segment is not a port"""
+        assert LegacyFormatParser.parse_host_port("fe80::abcd") is None
+
     def test_parse_serial_port_com(self):
         """Test COM port parsing"""
         result = LegacyFormatParser.parse_serial_port("COM1")
@@ -108,6 +138,7 @@ class TestLegacyFormatParser:
         assert LegacyFormatParser.parse_serial_port("localhost") is None
         assert LegacyFormatParser.parse_serial_port("COM") is None
         assert LegacyFormatParser.parse_serial_port("/dev/") is None
+        assert LegacyFormatParser.parse_serial_port("COM1\n") is None
 
     def test_parse_priority(self):
         """Test parsing priority (host:port over serial)"""
@@ -153,9 +184,9 @@ class TestStandardUriParser:
         result = StandardUriParser.parse(uri)
         assert result.scheme == "serial"
         assert result.path == "/dev/ttyUSB0"
-        assert result.query_params["baudrate"] == ["9600"]
-        assert result.query_params["parity"] == ["E"]
-        assert result.query_params["timeout"] == ["5"]
+        assert result.query_params["baudrate"] == ("9600",)
+        assert result.query_params["parity"] == ("E",)
+        assert result.query_params["timeout"] == ("5",)
 
     def test_parse_dummy(self):
         """Test dummy URI"""
@@ -172,13 +203,19 @@ class TestStandardUriParser:
         with pytest.raises(ValueError, match="Invalid URI format"):
             StandardUriParser.parse("telnet://localhost:invalid")
 
+    def test_parse_path_with_semicolon(self):
+        """Test semicolons stay in the path instead of being split as params"""
+        result = StandardUriParser.parse("serial:///dev/tty;1?baudrate=9600")
+        assert result.path == "/dev/tty;1"
+        assert result.query_params["baudrate"] == ("9600",)
+
     def test_parse_with_path_and_query(self):
         """Test URI with both path and query"""
         uri = "serial:///dev/ttyUSB0?baudrate=115200"
         result = StandardUriParser.parse(uri)
         assert result.scheme == "serial"
         assert result.path == "/dev/ttyUSB0"
-        assert result.query_params["baudrate"] == ["115200"]
+        assert result.query_params["baudrate"] == ("115200",)
 
 
 class TestUriParser:
@@ -209,7 +246,45 @@ class TestUriParser:
         result = UriParser.parse("serial:///dev/ttyUSB0?baudrate=9600")
         assert result.scheme == "serial"
         assert result.path == "/dev/ttyUSB0"
-        assert result.query_params["baudrate"] == ["9600"]
+        assert result.query_params["baudrate"] == ("9600",)
+
+    def test_parse_caches_result(self):
+        """Test repeated URI returns the cached ParsedUri"""
+        first = UriParser.parse("serial:///dev/ttyS9?baudrate=9600")
+        second = UriParser.parse("serial:///dev/ttyS9?baudrate=9600")
+        assert first is second
+
+    def test_parse_result_is_read_only(self):
+        """Test cached ParsedUri cannot be modified by callers"""
+        result = UriParser.parse("serial:///dev/ttyS9?baudrate=9600")
+        with pytest.raises(FrozenInstanceError):
+            result.port = 1
+        with pytest.raises(TypeError):
+            result.query_params["baudrate"] = ["1"]
+        # 値もタプルなので、共有されたキャッシュの中身は書き換えられない
+        with pytest.raises(TypeError):
+            result.query_params["baudrate"][0] = "1"  # type: ignore[index]
+        again = UriParser.parse("serial:///dev/ttyS9?baudrate=9600")
+        assert again.query_params["baudrate"] == ("9600",)
+
+    def test_parse_result_is_hashable(self):
+        """Test ParsedUri with query parameters can be hashed"""
+        result = UriParser.parse("serial:///dev/ttyS9?baudrate=9600")
+        copy = ParsedUri(
+            scheme="serial", path="/dev/ttyS9", query_params={"baudrate": ("9600",)}
+        )
+        assert copy == result
+        assert hash(copy) == hash(result)
+        assert {result: "cached"}[copy] == "cached"
+
+    def test_parse_without_query_shares_empty_params(self):
+        """Test URIs without a query share one empty read-only mapping"""
+        telnet = UriParser.parse("telnet://localhost:2223")
+        serial = UriParser.parse("serial:///dev/ttyS8")
+        assert telnet.query_params == {}
+        assert telnet.query_params is serial.query_params
+        with pytest.raises(TypeError):
+            telnet.query_params["baudrate"] = ["1"]
 
     def test_parse_empty_uri(self):
         """Test empty URI"""